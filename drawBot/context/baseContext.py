@@ -1,6 +1,12 @@
+import bisect
+import functools
+import itertools
 import math
+import numbers
 import os
-from typing import Any, Self
+import sys
+from collections import OrderedDict
+from typing import Any, Iterable, Self
 
 import AppKit  # type: ignore
 import CoreText  # type: ignore
@@ -31,18 +37,79 @@ _LINECAPSTYLESMAP = dict(
     square=Quartz.kCGLineCapSquare,
     round=Quartz.kCGLineCapRound,
 )
+_IDENTITYTRANSFORM = (1, 0, 0, 1, 0, 0)
+
+# compare the macOS version once instead of parsing a Version on every FormattedString.append
+_NSFONTFEATURESFALLBACK = macOSVersion < Version("10.13")
+_NSKERNTRACKINGFALLBACK = macOSVersion < Version("10.12")
+_CTTYPESETTEROPTIONS = macOSVersion >= Version("10.14")
+
+# bind the path element types once as plain ints
+_MOVETOELEMENT = int(AppKit.NSMoveToBezierPathElement)
+_LINETOELEMENT = int(AppKit.NSLineToBezierPathElement)
+_CURVETOELEMENT = int(AppKit.NSCurveToBezierPathElement)
+_CLOSEPATHELEMENT = int(AppKit.NSClosePathBezierPathElement)
+_CGMOVETOELEMENT = int(Quartz.kCGPathElementMoveToPoint)
+_CGLINETOELEMENT = int(Quartz.kCGPathElementAddLineToPoint)
+_CGCURVETOELEMENT = int(Quartz.kCGPathElementAddCurveToPoint)
+_CGCLOSEPATHELEMENT = int(Quartz.kCGPathElementCloseSubpath)
+
+# map NSBezierPath elements to the CGPath function and the number of points it takes
+_CGPATHFUNCTIONS = {
+    _MOVETOELEMENT: (Quartz.CGPathMoveToPoint, 1),
+    _LINETOELEMENT: (Quartz.CGPathAddLineToPoint, 1),
+    _CURVETOELEMENT: (Quartz.CGPathAddCurveToPoint, 3),
+    _CLOSEPATHELEMENT: (Quartz.CGPathCloseSubpath, 0),
+}
+_UNSUPPORTEDPATHELEMENT = (None, 0)
+
+
+@functools.lru_cache(maxsize=256)
+def _getNSAffineTransform(transformMatrix):
+    # NSAffineTransform objects are only read when applied to a path, so they can be shared
+    aT = AppKit.NSAffineTransform.alloc().init()
+    aT.setTransformStruct_(transformMatrix)
+    return aT
+
+
+@functools.lru_cache(maxsize=512)
+def _rotationCosSin(angle):
+    angle = math.radians(angle)
+    return math.cos(angle), math.sin(angle)
+
+
+@functools.lru_cache(maxsize=512)
+def _skewTangent(angle):
+    return math.tan(math.radians(angle))
+
+
+@functools.lru_cache(maxsize=256)
+def _getRectCGPath(x, y, w, h):
+    # text box paths are only read by the framesetter, so they can be shared
+    path = CoreText.CGPathCreateMutable()
+    CoreText.CGPathAddRect(path, None, CoreText.CGRectMake(x, y, w, h))
+    return path
+
+
+# the same cmyk colors are converted again and again when redrawing a palette
+_cachedCmyk2rgb = functools.lru_cache(maxsize=1024)(cmyk2rgb)
 
 
 # context specific attributes
 
 
 class ContextPropertyMixin:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # collect the copy functions of all base classes once
+        copyFunctions = (getattr(base, "_copyContextProperties", None) for base in cls.__bases__)
+        cls._copyContextPropertiesFunctions = tuple(func for func in copyFunctions if func is not None)
+
     def copyContextProperties(self, other):
-        # loop over all base classes
-        for cls in self.__class__.__bases__:
-            func = getattr(cls, "_copyContextProperties", None)
-            if func is not None:
-                func(self, other)
+        for func in self._copyContextPropertiesFunctions:
+            func(self, other)
 
 
 class contextProperty:
@@ -54,19 +121,29 @@ class contextProperty:
 
     def __set_name__(self, owner, name):
         self.name = name
+        # store the value in the owner's `_<name>` slot when available
+        self._slot = owner.__dict__.get(f"_{name}")
 
     def __get__(self, obj, cls=None):
         if obj is None:
             return self
-        return obj.__dict__.get(self.name)
+        if self._slot is None:
+            return obj.__dict__.get(self.name)
+        return self._slot.__get__(obj, cls)
 
     def __set__(self, obj, value):
         if self._validator:
             self._validator(value)
-        obj.__dict__[self.name] = value
+        if self._slot is None:
+            obj.__dict__[self.name] = value
+        else:
+            self._slot.__set__(obj, value)
 
     def __delete__(self, obj):
-        obj.__dict__.pop(self.name, None)
+        if self._slot is None:
+            obj.__dict__.pop(self.name, None)
+        else:
+            self._slot.__set__(obj, None)
 
     def _stringValidator(self, value):
         if value is None:
@@ -76,10 +153,18 @@ class contextProperty:
 
 
 class SVGContextPropertyMixin:
+    __slots__ = ("_svgID", "_svgClass", "_svgLink")
+
     svgID = contextProperty("The svg id, as a string.", "stringValidator")
     svgClass = contextProperty("The svg class, as a string.", "stringValidator")
     svgLink = contextProperty("The svg link, as a string.", "stringValidator")
 
+    def __new__(cls, *args, **kwargs):
+        # initialize the slots, an unset context property is None
+        self = super().__new__(cls)
+        self._svgID = self._svgClass = self._svgLink = None
+        return self
+
     def _copyContextProperties(self, other):
         self.svgID = other.svgID
         self.svgClass = other.svgClass
@@ -99,44 +184,61 @@ class BezierContour(list):
         return "<BezierContour>"
 
     def _get_clockwise(self):
-        from fontTools.pens.areaPen import AreaPen  # type: ignore
-
-        pen = AreaPen()
-        pen.endPath = pen.closePath
-        self.drawToPen(pen)
-        return pen.value < 0
+        # signed area calculated directly on the segments: the shoelace formula for lines
+        # and the closed form of Green's theorem for cubic curves, the contour is always closed
+        if not self:
+            return False
+        area = 0
+        startX, startY = x0, y0 = self[0][-1]
+        for segment in self[1:]:
+            if len(segment) == 1:
+                x3, y3 = segment[0]
+            else:
+                (x1, y1), (x2, y2), (x3, y3) = segment
+                dx1, dy1 = x1 - x0, y1 - y0
+                dx2, dy2 = x2 - x0, y2 - y0
+                dx3, dy3 = x3 - x0, y3 - y0
+                area -= (dx1 * (-dy2 - dy3) + dx2 * (dy1 - 2 * dy3) + dx3 * (dy1 + 2 * dy2)) * 0.15
+            area -= (x3 - x0) * (y3 + y0) * 0.5
+            x0, y0 = x3, y3
+        area -= (startX - x0) * (startY + y0) * 0.5
+        return area < 0
 
     clockwise = property(_get_clockwise, doc="A boolean representing if the contour has a clockwise direction.")
 
     def drawToPointPen(self, pointPen):
+        addPoint = pointPen.addPoint
         pointPen.beginPath()
         for i, segment in enumerate(self):
             if len(segment) == 1:
                 segmentType = "line"
                 if i == 0 and self.open:
                     segmentType = "move"
-                pointPen.addPoint(segment[0], segmentType=segmentType)
+                addPoint(segment[0], segmentType=segmentType)
             else:
-                pointPen.addPoint(segment[0])
-                pointPen.addPoint(segment[1])
-                pointPen.addPoint(segment[2], segmentType="curve")
+                pt1, pt2, pt3 = segment
+                addPoint(pt1)
+                addPoint(pt2)
+                addPoint(pt3, segmentType="curve")
         pointPen.endPath()
 
     def drawToPen(self, pen):
-        for i, segment in enumerate(self):
-            if i == 0:
-                pen.moveTo(*segment)
-            elif len(segment) == 1:
-                pen.lineTo(*segment)
-            else:
-                pen.curveTo(*segment)
+        if self:
+            pen.moveTo(*self[0])
+            lineTo = pen.lineTo
+            curveTo = pen.curveTo
+            for segment in itertools.islice(self, 1, None):
+                if len(segment) == 1:
+                    lineTo(segment[0])
+                else:
+                    curveTo(*segment)
         if self.open:
             pen.endPath()
         else:
             pen.closePath()
 
     def _get_points(self):
-        return tuple([point for segment in self for point in segment])
+        return tuple(itertools.chain.from_iterable(self))
 
     points = property(
         _get_points,
@@ -204,9 +306,9 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
     contourClass = BezierContour
 
     _instructionSegmentTypeMap = {
-        AppKit.NSMoveToBezierPathElement: "move",
-        AppKit.NSLineToBezierPathElement: "line",
-        AppKit.NSCurveToBezierPathElement: "curve",
+        _MOVETOELEMENT: "move",
+        _LINETOELEMENT: "line",
+        _CURVETOELEMENT: "curve",
     }
 
     def __init__(self, path=None, glyphSet=None):
@@ -214,11 +316,26 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
             self._path = AppKit.NSBezierPath.alloc().init()
         else:
             self._path = path
+        # a NSBezierPath given by or handed out to the caller can be changed outside this object,
+        # the cached representations of the path are not kept for a shared NSBezierPath
+        self._pathIsShared = path is not None
+        self._cgPathCache = None
+        self._booleanOperationsContoursCache = None
+        self._contoursCache = None
+        self._pointsCache = None
+        self._pointToSegmentPen = None
         BasePen.__init__(self, glyphSet)
 
     def __repr__(self):
         return "<BezierPath>"
 
+    def _invalidateCache(self):
+        # must be called after every change to the NSBezierPath
+        self._cgPathCache = None
+        self._booleanOperationsContoursCache = None
+        self._contoursCache = None
+        self._pointsCache = None
+
     # pen support
 
     def moveTo(self, point: Point):
@@ -229,6 +346,7 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
 
     def _moveTo(self, pt):
         self._path.moveToPoint_(pt)
+        self._invalidateCache()
 
     def lineTo(self, point: Point):
         """
@@ -238,6 +356,7 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
 
     def _lineTo(self, pt):
         self._path.lineToPoint_(pt)
+        self._invalidateCache()
 
     def curveTo(self, *points: Point):
         """
@@ -263,12 +382,14 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         With given bezier handles `x1`, `y1` and `x2`, `y2`.
         """
         self._path.curveToPoint_controlPoint1_controlPoint2_(pt3, pt1, pt2)
+        self._invalidateCache()
 
     def closePath(self):
         """
         Close the path.
         """
         self._path.closePath()
+        self._invalidateCache()
 
     def beginPath(self, identifier=None):
         """
@@ -292,7 +413,7 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         Use the path as a point pen and add a point to the current subpath. `beginPath` must
         have been called prior to adding points with `addPoint` calls.
         """
-        if not hasattr(self, "_pointToSegmentPen"):
+        if self._pointToSegmentPen is None:
             raise DrawBotError("path.beginPath() must be called before the path can be used as a point pen")
         self._pointToSegmentPen.addPoint(
             point,
@@ -315,10 +436,10 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         `endPath`), the path will process all the points added with `addPoint`, finishing
         the current subpath.
         """
-        if hasattr(self, "_pointToSegmentPen"):
+        if self._pointToSegmentPen is not None:
             # its been used in a point pen world
             pointToSegmentPen = self._pointToSegmentPen
-            del self._pointToSegmentPen
+            self._pointToSegmentPen = None
             pointToSegmentPen.endPath()
         else:
             # with NSBezierPath, nothing special needs to be done for an open subpath.
@@ -365,6 +486,7 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         self._path.appendBezierPathWithArcWithCenter_radius_startAngle_endAngle_clockwise_(
             center, radius, startAngle, endAngle, clockwise
         )
+        self._invalidateCache()
 
     def arcTo(self, point1: Point, point2: Point, radius: float):
         """
@@ -372,12 +494,23 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         the current point, `point1`, and `point2`. The arc is drawn between the two points of the circle that are tangent to the two legs of the angle.
         """
         self._path.appendBezierPathWithArcFromPoint_toPoint_radius_(point1, point2, radius)
+        self._invalidateCache()
 
     def rect(self, x: float, y: float, w: float, h: float):
         """
         Add a rectangle at possition `x`, `y` with a size of `w`, `h`
         """
         self._path.appendBezierPathWithRect_(((x, y), (w, h)))
+        self._invalidateCache()
+
+    def rects(self, rects: Iterable[tuple[float, float, float, float]]):
+        """
+        Add multiple rectangles at once, each given as `(x, y, w, h)`.
+        """
+        nsRects = [((x, y), (w, h)) for x, y, w, h in rects]
+        if nsRects:
+            self._path.appendBezierPathWithRects_count_(nsRects, len(nsRects))
+            self._invalidateCache()
 
     def oval(self, x: float, y: float, w: float, h: float):
         """
@@ -386,6 +519,17 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         self._path.appendBezierPathWithOvalInRect_(((x, y), (w, h)))
         self.closePath()
 
+    def ovals(self, ovals: Iterable[tuple[float, float, float, float]]):
+        """
+        Add multiple ovals at once, each given as `(x, y, w, h)`.
+        """
+        appendOval = self._path.appendBezierPathWithOvalInRect_
+        closePath = self._path.closePath
+        for x, y, w, h in ovals:
+            appendOval(((x, y), (w, h)))
+            closePath()
+        self._invalidateCache()
+
     def line(self, point1: Point, point2: Point):
         """
         Add a line between two given points.
@@ -393,6 +537,16 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         self.moveTo(point1)
         self.lineTo(point2)
 
+    def lines(self, lines: Iterable[tuple[Point, Point]]):
+        """
+        Add multiple lines at once, each given as a pair of points.
+        """
+        moveTo = self.moveTo
+        lineTo = self.lineTo
+        for point1, point2 in lines:
+            moveTo(point1)
+            lineTo(point2)
+
     def polygon(self, *points: Point, **kwargs):
         """
         Draws a polygon with n-amount of points.
@@ -406,8 +560,14 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
             raise TypeError("unexpected keyword argument for this function")
 
         self.moveTo(points[0])
-        for x, y in points[1:]:
-            self.lineTo((x, y))
+        innerPoints = [(x, y) for x, y in points[1:-1]]
+        if innerPoints:
+            # add all line segments with a single call
+            self._path.appendBezierPathWithPoints_count_(innerPoints, len(innerPoints))
+            self._invalidateCache()
+        # draw the last point through the pen to keep track of the current point
+        x, y = points[-1]
+        self.lineTo((x, y))
         if doClose:
             self.closePath()
 
@@ -488,6 +648,8 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         ctLines = CoreText.CTFrameGetLines(frame)
         origins = CoreText.CTFrameGetLineOrigins(frame, (0, len(ctLines)), None)
 
+        moveToPoint = self._path.moveToPoint_
+        appendGlyph = self._path.appendBezierPathWithGlyph_inFont_
         for i, (originX, originY) in enumerate(origins):
             ctLine = ctLines[i]
             ctRuns = CoreText.CTLineGetGlyphRuns(ctLine)
@@ -496,12 +658,23 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
                 font = attributes.get(AppKit.NSFontAttributeName)
                 baselineShift = attributes.get(AppKit.NSBaselineOffsetAttributeName, 0)
                 glyphCount = CoreText.CTRunGetGlyphCount(ctRun)
-                for i in range(glyphCount):
-                    glyph = CoreText.CTRunGetGlyphs(ctRun, (i, 1), None)[0]
-                    ax, ay = CoreText.CTRunGetPositions(ctRun, (i, 1), None)[0]
+                # read the glyph and position buffers of the run directly when available,
+                # otherwise get a copy of all glyphs and positions of the run at once
+                glyphs = CoreText.CTRunGetGlyphsPtr(ctRun)
+                if glyphs is None:
+                    glyphs = CoreText.CTRunGetGlyphs(ctRun, (0, glyphCount), None)
+                positions = CoreText.CTRunGetPositionsPtr(ctRun)
+                if positions is None:
+                    positions = CoreText.CTRunGetPositions(ctRun, (0, glyphCount), None)
+                runX = x + originX
+                runY = y + originY
+                for glyphIndex in range(glyphCount):
+                    glyph = glyphs[glyphIndex]
                     if glyph:
-                        self._path.moveToPoint_((x + originX + ax, y + originY + ay + baselineShift))
-                        self._path.appendBezierPathWithGlyph_inFont_(glyph, font)
+                        ax, ay = positions[glyphIndex]
+                        moveToPoint((runX + ax, runY + ay + baselineShift))
+                        appendGlyph(glyph, font)
+        self._invalidateCache()
         self.optimizePath()
         return context.clippedText(txt, box, align)
 
@@ -535,46 +708,66 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         """
         Return the nsBezierPath.
         """
+        self._pathIsShared = True
         return self._path
 
+    def _iterElements(self):
+        # read the element count once and bind the bridged method to a local,
+        # this avoids an attribute lookup on every element
+        elementAtIndex = self._path.elementAtIndex_associatedPoints_
+        for i in range(self._path.elementCount()):
+            yield elementAtIndex(i)
+
     def _getCGPath(self):
+        if self._cgPathCache is None or self._pathIsShared:
+            self._cgPathCache = self._buildCGPath()
+        return self._cgPathCache
+
+    def _buildCGPath(self):
         path = Quartz.CGPathCreateMutable()
-        count = self._path.elementCount()
-        for i in range(count):
-            instruction, points = self._path.elementAtIndex_associatedPoints_(i)
-            if instruction == AppKit.NSMoveToBezierPathElement:
-                Quartz.CGPathMoveToPoint(path, None, points[0].x, points[0].y)
-            elif instruction == AppKit.NSLineToBezierPathElement:
-                Quartz.CGPathAddLineToPoint(path, None, points[0].x, points[0].y)
-            elif instruction == AppKit.NSCurveToBezierPathElement:
-                Quartz.CGPathAddCurveToPoint(
-                    path, None, points[0].x, points[0].y, points[1].x, points[1].y, points[2].x, points[2].y
-                )
-            elif instruction == AppKit.NSClosePathBezierPathElement:
-                Quartz.CGPathCloseSubpath(path)
+        for instruction, points in self._iterElements():
+            func, pointCount = _CGPATHFUNCTIONS.get(instruction, _UNSUPPORTEDPATHELEMENT)
+            if pointCount == 1:
+                pt = points[0]
+                func(path, None, pt.x, pt.y)
+            elif pointCount == 3:
+                pt1, pt2, pt3 = points
+                func(path, None, pt1.x, pt1.y, pt2.x, pt2.y, pt3.x, pt3.y)
+            elif func is not None:
+                func(path)
         return path
 
     def _setCGPath(self, cgpath):
-        self._path = AppKit.NSBezierPath.alloc().init()
+        nsPath = AppKit.NSBezierPath.alloc().init()
+        nsPathFunctions = {
+            _CGMOVETOELEMENT: (nsPath.moveToPoint_, 1),
+            _CGLINETOELEMENT: (nsPath.lineToPoint_, 1),
+            _CGCURVETOELEMENT: (nsPath.curveToPoint_controlPoint1_controlPoint2_, 3),
+            _CGCLOSEPATHELEMENT: (nsPath.closePath, 0),
+        }
 
         def _addPoints(arg, element):
-            instruction, points = element.type, element.points
-            if instruction == Quartz.kCGPathElementMoveToPoint:
-                self._path.moveToPoint_(points[0])
-            elif instruction == Quartz.kCGPathElementAddLineToPoint:
-                self._path.lineToPoint_(points[0])
-            elif instruction == Quartz.kCGPathElementAddCurveToPoint:
-                self._path.curveToPoint_controlPoint1_controlPoint2_(points[2], points[0], points[1])
-            elif instruction == Quartz.kCGPathElementCloseSubpath:
-                self._path.closePath()
+            func, pointCount = nsPathFunctions.get(element.type, _UNSUPPORTEDPATHELEMENT)
+            if pointCount == 1:
+                func(element.points[0])
+            elif pointCount == 3:
+                points = element.points
+                func(points[2], points[0], points[1])
+            elif func is not None:
+                func()
 
         Quartz.CGPathApply(cgpath, None, _addPoints)
+        self._path = nsPath
+        self._pathIsShared = False
+        self._invalidateCache()
 
     def setNSBezierPath(self, path: AppKit.NSBezierPath):
         """
         Set a nsBezierPath.
         """
         self._path = path
+        self._pathIsShared = True
+        self._invalidateCache()
 
     def pointInside(self, xy: Point) -> bool:
         """
@@ -605,28 +798,36 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
 
     def optimizePath(self):
         count = self._path.elementCount()
-        if not count or self._path.elementAtIndex_(count - 1) != AppKit.NSMoveToBezierPathElement:
+        if not count or self._path.elementAtIndex_(count - 1) != _MOVETOELEMENT:
             return
         optimizedPath = AppKit.NSBezierPath.alloc().init()
-        for i in range(count - 1):
-            instruction, points = self._path.elementAtIndex_associatedPoints_(i)
-            if instruction == AppKit.NSMoveToBezierPathElement:
-                optimizedPath.moveToPoint_(*points)
-            elif instruction == AppKit.NSLineToBezierPathElement:
-                optimizedPath.lineToPoint_(*points)
-            elif instruction == AppKit.NSCurveToBezierPathElement:
+        moveToPoint = optimizedPath.moveToPoint_
+        lineToPoint = optimizedPath.lineToPoint_
+        curveToPoint = optimizedPath.curveToPoint_controlPoint1_controlPoint2_
+        closePath = optimizedPath.closePath
+        # skip the trailing move
+        for instruction, points in itertools.islice(self._iterElements(), count - 1):
+            if instruction == _MOVETOELEMENT:
+                moveToPoint(points[0])
+            elif instruction == _LINETOELEMENT:
+                lineToPoint(points[0])
+            elif instruction == _CURVETOELEMENT:
                 p1, p2, p3 = points
-                optimizedPath.curveToPoint_controlPoint1_controlPoint2_(p3, p1, p2)
-            elif instruction == AppKit.NSClosePathBezierPathElement:
-                optimizedPath.closePath()
+                curveToPoint(p3, p1, p2)
+            elif instruction == _CLOSEPATHELEMENT:
+                closePath()
         self._path = optimizedPath
+        self._invalidateCache()
 
     def copy(self) -> Self:
         """
         Copy the bezier path.
         """
-        new = self.__class__()
-        new._path = self._path.copy()
+        new = self.__class__(self._path.copy())
+        # the copied NSBezierPath is private to the new object
+        new._pathIsShared = False
+        # the CGPath is only read, the copy can share it until one of them changes
+        new._cgPathCache = self._cgPathCache
         new.copyContextProperties(self)
         return new
 
@@ -635,12 +836,14 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         Reverse the path direction
         """
         self._path = self._path.bezierPathByReversingPath()
+        self._invalidateCache()
 
     def appendPath(self, otherPath: Self):
         """
         Append a path.
         """
-        self._path.appendBezierPath_(otherPath.getNSBezierPath())
+        self._path.appendBezierPath_(otherPath._path)
+        self._invalidateCache()
 
     def __add__(self, otherPath: Self) -> Self:
         new = self.copy()
@@ -663,9 +866,9 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         """
         Rotate the path around the `center` point (which is the origin by default) with a given angle in degrees.
         """
-        angle = math.radians(angle)
-        c = math.cos(angle)
-        s = math.sin(angle)
+        if angle % 360 == 0:
+            return
+        c, s = _rotationCosSin(angle)
         self.transform((c, s, -s, c, 0, 0), center)
 
     def scale(self, x: float = 1, y: float | None = None, center: Point = (0, 0)):
@@ -688,31 +891,35 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
 
         The center of skewing can optionally be set via the `center` keyword argument. By default this is the origin.
         """
-        angle1 = math.radians(angle1)
-        angle2 = math.radians(angle2)
-        self.transform((1, math.tan(angle2), math.tan(angle1), 1, 0, 0), center)
+        self.transform((1, _skewTangent(angle2), _skewTangent(angle1), 1, 0, 0), center)
 
     def transform(self, transformMatrix: TransformTuple, center: Point = (0, 0)):
         """
         Transform a path with a transform matrix (xy, xx, yy, yx, x, y).
         """
+        transformMatrix = tuple(transformMatrix)
+        if transformMatrix == _IDENTITYTRANSFORM:
+            # an identity transformation does not change the path, around any center
+            return
         if center != (0, 0):
             transformMatrix = transformationAtCenter(transformMatrix, center)
-        aT = AppKit.NSAffineTransform.alloc().init()
-        aT.setTransformStruct_(transformMatrix[:])
-        self._path.transformUsingAffineTransform_(aT)
+        self._path.transformUsingAffineTransform_(_getNSAffineTransform(transformMatrix))
+        self._invalidateCache()
 
     # boolean operations
 
     def _contoursForBooleanOperations(self):
-        # contours are very temporaly objects
-        # redirect drawToPointPen to drawPoints
-        contours = self.contours
-        for contour in contours:
-            contour.drawPoints = contour.drawToPointPen
-            if contour.open:
-                raise DrawBotError("open contours are not supported during boolean operations")
-        return contours
+        if self._booleanOperationsContoursCache is None or self._pathIsShared:
+            # contours are very temporaly objects
+            # redirect drawToPointPen to drawPoints
+            contours = self.contours
+            for contour in contours:
+                contour.drawPoints = contour.drawToPointPen
+                if contour.open:
+                    raise DrawBotError("open contours are not supported during boolean operations")
+            self._booleanOperationsContoursCache = contours
+        # return a new list, callers are allowed to extend it
+        return list(self._booleanOperationsContoursCache)
 
     def union(self, other: Self) -> Self:
         """
@@ -721,7 +928,8 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         assert isinstance(other, self.__class__)
         import booleanOperations  # type: ignore
 
-        contours = self._contoursForBooleanOperations() + other._contoursForBooleanOperations()
+        contours = self._contoursForBooleanOperations()
+        contours.extend(other._contoursForBooleanOperations())
         result = self.__class__()
         booleanOperations.union(contours, result)
         return result
@@ -735,7 +943,9 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         contours = self._contoursForBooleanOperations()
         result = self.__class__()
         booleanOperations.union(contours, result)
-        self.setNSBezierPath(result.getNSBezierPath())
+        self._path = result._path
+        self._pathIsShared = False
+        self._invalidateCache()
         return self
 
     def difference(self, other: Self) -> Self:
@@ -788,7 +998,7 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         contours = self._contoursForBooleanOperations()
         if other is not None:
             assert isinstance(other, self.__class__)
-            contours += other._contoursForBooleanOperations()
+            contours.extend(other._contoursForBooleanOperations())
         return booleanOperations.getIntersections(contours)
 
     def expandStroke(
@@ -804,14 +1014,14 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         * `lineJoin`: Possible values are `"bevel"`, `"miter"` or `"round"`
         * `miterLimit`: The miter limit to use for `"miter"` lineJoin option
         """
-        if lineJoin not in _LINEJOINSTYLESMAP:
+        join = _LINEJOINSTYLESMAP.get(lineJoin)
+        if join is None:
             raise DrawBotError("lineJoin must be 'bevel', 'miter' or 'round'")
-        if lineCap not in _LINECAPSTYLESMAP:
+        cap = _LINECAPSTYLESMAP.get(lineCap)
+        if cap is None:
             raise DrawBotError("lineCap must be 'butt', 'square' or 'round'")
 
-        strokedCGPath = Quartz.CGPathCreateCopyByStrokingPath(
-            self._getCGPath(), None, width, _LINECAPSTYLESMAP[lineCap], _LINEJOINSTYLESMAP[lineJoin], miterLimit
-        )
+        strokedCGPath = Quartz.CGPathCreateCopyByStrokingPath(self._getCGPath(), None, width, cap, join, miterLimit)
         result = self.__class__()
         result._setCGPath(strokedCGPath)
         return result
@@ -837,7 +1047,9 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
 
     def __imod__(self, other: Self) -> Self:
         result = self.difference(other)
-        self.setNSBezierPath(result.getNSBezierPath())
+        self._path = result._path
+        self._pathIsShared = False
+        self._invalidateCache()
         return self
 
     def __or__(self, other: Self) -> Self:
@@ -847,7 +1059,9 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
 
     def __ior__(self, other: Self) -> Self:
         result = self.union(other)
-        self.setNSBezierPath(result.getNSBezierPath())
+        self._path = result._path
+        self._pathIsShared = False
+        self._invalidateCache()
         return self
 
     def __and__(self, other: Self) -> Self:
@@ -857,7 +1071,9 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
 
     def __iand__(self, other: Self) -> Self:
         result = self.intersection(other)
-        self.setNSBezierPath(result.getNSBezierPath())
+        self._path = result._path
+        self._pathIsShared = False
+        self._invalidateCache()
         return self
 
     def __xor__(self, other: Self) -> Self:
@@ -867,21 +1083,37 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
 
     def __ixor__(self, other: Self) -> Self:
         result = self.xor(other)
-        self.setNSBezierPath(result.getNSBezierPath())
+        self._path = result._path
+        self._pathIsShared = False
+        self._invalidateCache()
         return self
 
     def _points(self, onCurve=True, offCurve=True):
-        points = []
-        if not onCurve and not offCurve:
-            return points
-        for index in range(self._path.elementCount()):
-            instruction, pts = self._path.elementAtIndex_associatedPoints_(index)
-            if not onCurve:
-                pts = pts[:-1]
-            elif not offCurve:
-                pts = pts[-1:]
-            points.extend([(p.x, p.y) for p in pts])
-        return tuple(points)
+        if self._pointsCache is None or self._pathIsShared:
+            self._pointsCache = self._collectPoints()
+        allPoints, onCurvePoints, offCurvePoints = self._pointsCache
+        if onCurve and offCurve:
+            return allPoints
+        elif onCurve:
+            return onCurvePoints
+        elif offCurve:
+            return offCurvePoints
+        return []
+
+    def _collectPoints(self):
+        # collect all, on curve and off curve points in a single walk over the path
+        allPoints = []
+        onCurvePoints = []
+        offCurvePoints = []
+        for instruction, pts in self._iterElements():
+            if not pts:
+                continue
+            # NSPoint structs are sequences, convert them without attribute lookups
+            pts = list(map(tuple, pts))
+            allPoints.extend(pts)
+            onCurvePoints.append(pts[-1])
+            offCurvePoints.extend(pts[:-1])
+        return tuple(allPoints), tuple(onCurvePoints), tuple(offCurvePoints)
 
     def _get_points(self):
         return self._points()
@@ -906,16 +1138,32 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
         doc="Return an immutable list of all off curve points in the BezierPath as point coordinate `(x, y)` tuples.",
     )
 
+    def _getCachedContours(self):
+        if self._contoursCache is None or self._pathIsShared:
+            self._contoursCache = self._collectContours()
+        return self._contoursCache
+
     def _get_contours(self):
+        # return new contours, changes made by the caller must not end up in the cache
+        contourClass = self.contourClass
         contours = []
-        for index in range(self._path.elementCount()):
-            instruction, pts = self._path.elementAtIndex_associatedPoints_(index)
-            if instruction == AppKit.NSMoveToBezierPathElement:
-                contours.append(self.contourClass())
-            if instruction == AppKit.NSClosePathBezierPathElement:
+        for cachedContour in self._getCachedContours():
+            contour = contourClass(list(segment) for segment in cachedContour)
+            contour.open = cachedContour.open
+            contours.append(contour)
+        return tuple(contours)
+
+    def _collectContours(self):
+        contours = []
+        contourClass = self.contourClass
+        for instruction, pts in self._iterElements():
+            if instruction == _MOVETOELEMENT:
+                contours.append(contourClass())
+            if instruction == _CLOSEPATHELEMENT:
                 contours[-1].open = False
             if pts:
-                contours[-1].append([(p.x, p.y) for p in pts])
+                # NSPoint structs are sequences, convert them without attribute lookups
+                contours[-1].append(list(map(tuple, pts)))
         if len(contours) >= 2 and len(contours[-1]) == 1 and contours[-1][0] == contours[-2][0]:
             contours.pop()
         return tuple(contours)
@@ -926,19 +1174,19 @@ class BezierPath(BasePen, SVGContextPropertyMixin, ContextPropertyMixin):
     )
 
     def __len__(self) -> int:
-        return len(self.contours)
+        return len(self._getCachedContours())
 
     def __getitem__(self, index):
-        return self.contours[index]
+        return self._get_contours()[index]
 
     def __iter__(self):
-        contours = self.contours
-        count = len(contours)
-        index = 0
-        while index < count:
-            contour = contours[index]
-            yield contour
-            index += 1
+        return iter(self._get_contours())
+
+
+@functools.lru_cache(maxsize=512)
+def _makeNSColorRGBA(r, g, b, a, colorSpace):
+    # NSColor objects are immutable, so they can be shared between Color objects
+    return AppKit.NSColor.colorWithCalibratedRed_green_blue_alpha_(r, g, b, a).colorUsingColorSpace_(colorSpace)
 
 
 class Color:
@@ -949,14 +1197,14 @@ class Color:
         if r is None:
             return
         if isinstance(r, AppKit.NSColor):
-            self._color = r
-        elif g is None and b is None:
-            self._color = AppKit.NSColor.colorWithCalibratedRed_green_blue_alpha_(r, r, r, a)
+            self._color = r.colorUsingColorSpace_(self.colorSpace)
+            return
+        if g is None and b is None:
+            g = b = r
         elif b is None:
-            self._color = AppKit.NSColor.colorWithCalibratedRed_green_blue_alpha_(r, r, r, g)
-        else:
-            self._color = AppKit.NSColor.colorWithCalibratedRed_green_blue_alpha_(r, g, b, a)
-        self._color = self._color.colorUsingColorSpace_(self.colorSpace)
+            a = g
+            g = b = r
+        self._color = _makeNSColorRGBA(r, g, b, a, self.colorSpace)
 
     def set(self):
         self._color.set()
@@ -969,7 +1217,8 @@ class Color:
 
     def copy(self):
         new = self.__class__()
-        new._color = self._color.copy()
+        # NSColor objects are immutable, there is no need to copy them
+        new._color = self._color
         return new
 
     @classmethod
@@ -982,7 +1231,7 @@ class Color:
 
     @classmethod
     def getColor(cls, color):
-        if isinstance(color, cls.__class__):
+        if type(color) is cls:
             return color
         elif isinstance(color, (tuple, list)):
             return cls(*color)
@@ -1046,7 +1295,7 @@ class Gradient:
         self.gradientType = gradientType
         self.colors = self._colorClass.getColorsFromList(colors)
         self.cmykColors = None
-        self.positions = positions
+        self.positions = tuple(positions)
         self.start = start
         self.end = end
         self.startRadius = startRadius
@@ -1059,7 +1308,7 @@ class Gradient:
         new.cmykColors = None
         if self.cmykColors:
             new.cmykColors = [color.copy() for color in self.cmykColors]
-        new.positions = list(self.positions)
+        new.positions = self.positions
         new.start = self.start
         new.end = self.end
         new.startRadius = self.startRadius
@@ -1075,16 +1324,32 @@ def makeTextBoxes(attributedString, xy, align, plainText):
 
     if align is not None:
         attributedString = attributedString.mutableCopy()
-
-        # overwrite all align settings in each paragraph style
-        def block(value, rng, stop):
-            value = value.mutableCopy()
-            value.setAlignment_(FormattedString._textAlignMap[align])
-            attributedString.addAttribute_value_range_(AppKit.NSParagraphStyleAttributeName, value, rng)
-
-        attributedString.enumerateAttribute_inRange_options_usingBlock_(
-            AppKit.NSParagraphStyleAttributeName, (0, len(attributedString)), 0, block
-        )
+        alignment = FormattedString._textAlignMap[align]
+        fullRange = (0, len(attributedString))
+        para = None
+        paraRange = None
+        if fullRange[1]:
+            para, paraRange = attributedString.attribute_atIndex_longestEffectiveRange_inRange_(
+                AppKit.NSParagraphStyleAttributeName, 0, None, fullRange
+            )
+        if paraRange is not None and paraRange[1] == fullRange[1]:
+            # a single paragraph style for the whole string, overwrite the align setting at once
+            if para is None:
+                para = AppKit.NSMutableParagraphStyle.alloc().init()
+            else:
+                para = para.mutableCopy()
+            para.setAlignment_(alignment)
+            attributedString.addAttribute_value_range_(AppKit.NSParagraphStyleAttributeName, para, fullRange)
+        else:
+            # overwrite all align settings in each paragraph style
+            def block(value, rng, stop):
+                value = value.mutableCopy()
+                value.setAlignment_(alignment)
+                attributedString.addAttribute_value_range_(AppKit.NSParagraphStyleAttributeName, value, rng)
+
+            attributedString.enumerateAttribute_inRange_options_usingBlock_(
+                AppKit.NSParagraphStyleAttributeName, fullRange, 0, block
+            )
 
     setter = newFramesetterWithAttributedString(attributedString)
     path = Quartz.CGPathCreateMutable()
@@ -1097,17 +1362,22 @@ def makeTextBoxes(attributedString, xy, align, plainText):
         return boxes
 
     firstLineJump = h * 2 - origins[0].y
+    # line origins are relative to the bounding box of the frame path,
+    # so all sub frames can share a single path
+    subPath = Quartz.CGPathCreateMutable()
+    Quartz.CGPathAddRect(subPath, None, Quartz.CGRectMake(0, 0, w, h * 2))
 
     isFirstLine = True
     for ctLine, (originX, originY) in zip(ctLines, origins):
         rng = CoreText.CTLineGetStringRange(ctLine)
 
-        attributedSubstring = attributedString.attributedSubstringFromRange_(rng)
-        para, _ = attributedSubstring.attribute_atIndex_effectiveRange_(AppKit.NSParagraphStyleAttributeName, 0, None)
-
-        width, height = attributedSubstring.size()
-
-        if attributedSubstring.length() > 0:
+        if rng.length > 0:
+            attributedSubstring = attributedString.attributedSubstringFromRange_(rng)
+            # read the paragraph style directly from the full string
+            para, _ = attributedString.attribute_atIndex_effectiveRange_(
+                AppKit.NSParagraphStyleAttributeName, rng.location, None
+            )
+            width, height = attributedSubstring.size()
             width += extraPadding
             originX = 0
             if para is not None:
@@ -1116,7 +1386,7 @@ def makeTextBoxes(attributedString, xy, align, plainText):
                 elif para.alignment() == AppKit.NSTextAlignmentRight:
                     originX = -width
 
-            if attributedSubstring.string()[-1] in ["\n", "\r"]:
+            if attributedSubstring.string()[-1] in ("\n", "\r"):
                 attributedSubstring = attributedSubstring.mutableCopy()
                 attributedSubstring.deleteCharactersInRange_((rng.length - 1, 1))
             if plainText:
@@ -1133,8 +1403,6 @@ def makeTextBoxes(attributedString, xy, align, plainText):
             else:
                 lineY = y + originY + firstLineJump - h * 2
                 subSetter = newFramesetterWithAttributedString(attributedSubstring)
-                subPath = Quartz.CGPathCreateMutable()
-                Quartz.CGPathAddRect(subPath, None, Quartz.CGRectMake(lineX, lineY, w, h * 2))
                 subFrame = CoreText.CTFramesetterCreateFrame(subSetter, (0, 0), subPath, None)
                 subOrigins = CoreText.CTFrameGetLineOrigins(subFrame, (0, 1), None)
                 if subOrigins:
@@ -1151,6 +1419,15 @@ def makeTextBoxes(attributedString, xy, align, plainText):
     return boxes
 
 
+def _hashableValue(value):
+    # convert (nested) lists and dicts into tuples, keeping the order of dict items
+    if isinstance(value, dict):
+        return tuple((key, _hashableValue(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashableValue(item) for item in value)
+    return value
+
+
 class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
     """
     Return a string object that can handle text formatting.
@@ -1228,6 +1505,9 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
 
     _writingDirectionMap = dict(LTR=AppKit.NSWritingDirectionLeftToRight, RTL=AppKit.NSWritingDirectionRightToLeft)
 
+    # the maximum number of text attribute dicts kept for reuse by `append`
+    _attributesCacheSize = 32
+
     _formattedAttributes: dict[str, Any] = dict(
         font=_FALLBACKFONT,
         fallbackFont=None,
@@ -1258,14 +1538,32 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         writingDirection=None,
     )
 
+    # names of the private attributes holding the current text properties
+    _formattedAttributeNames = tuple(f"_{attributeName}" for attributeName in _formattedAttributes)
+
+    __slots__ = _formattedAttributeNames + (
+        "_attributedString",
+        "_attributesCache",
+        "_paragraphStyleKey",
+        "_paragraphStyle",
+        "_defaultVariationsKey",
+        "_defaultVariations",
+    )
+
     # typing of private dictionary attributes
     # generated from the _formattedAttributes during init
     _openTypeFeatures: dict[str, bool]
     _fontVariations: dict[str, float]
     _tabs: list[tuple[float, str]] | None
+    _language: str | None
 
     def __init__(self, txt: str | None = None, **kwargs):
         self.clear()
+        self._attributesCache: OrderedDict[tuple, dict] = OrderedDict()
+        self._paragraphStyleKey = None
+        self._paragraphStyle = None
+        self._defaultVariationsKey = None
+        self._defaultVariations = None
         # create all _<attributes> in the formatted text object
         # with default values
         for key, value in self._formattedAttributes.items():
@@ -1288,14 +1586,27 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         Return a dict with all current stylistic text properties.
         """
         properties = dict()
-        for attributeName, defaultValue in self._formattedAttributes.items():
-            value = getattr(self, f"_{attributeName}", defaultValue)
+        for (attributeName, defaultValue), privateName in zip(
+            self._formattedAttributes.items(), self._formattedAttributeNames
+        ):
+            value = getattr(self, privateName, defaultValue)
             # create new object if the value is a dictionary
             if isinstance(value, dict):
                 value = dict(value)
             properties[attributeName] = value
         return properties
 
+    def _styleKey(self):
+        # a hashable representation of all current text properties,
+        # the colors are converted to NSColors in the current color space
+        key = tuple(_hashableValue(getattr(self, privateName)) for privateName in self._formattedAttributeNames)
+        key += (self._colorClass.colorSpace,)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def _setAttribute(self, attribute, value):
         method = getattr(self, attribute)
         if isinstance(value, (list, tuple)):
@@ -1312,16 +1623,10 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
             if value is not None:
                 setattr(self, f"_{key}", value)
 
-        if self._fill is not None:
-            try:
-                len(self._fill)
-            except Exception:
-                self._fill = (self._fill,)
-        if self._stroke is not None:
-            try:
-                len(self._stroke)
-            except Exception:
-                self._stroke = (self._stroke,)
+        if isinstance(self._fill, numbers.Number):
+            self._fill = (self._fill,)
+        if isinstance(self._stroke, numbers.Number):
+            self._stroke = (self._stroke,)
         if self._fill:
             self._cmykFill = None
         elif self._cmykFill:
@@ -1391,6 +1696,22 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
             return
         elif not isinstance(txt, (str, FormattedString)):
             raise TypeError("expected 'str' or 'FormattedString', got '%s'" % type(txt).__name__)
+        styleKey = self._styleKey()
+        attributes = None
+        if styleKey is not None:
+            attributes = self._attributesCache.get(styleKey)
+        if attributes is None:
+            attributes = self._buildAttributes()
+            if styleKey is not None:
+                self._attributesCache[styleKey] = attributes
+                if len(self._attributesCache) > self._attributesCacheSize:
+                    self._attributesCache.popitem(last=False)
+        else:
+            self._attributesCache.move_to_end(styleKey)
+        txt = AppKit.NSAttributedString.alloc().initWithString_attributes_(txt, attributes)
+        self._attributedString.appendAttributedString_(txt)
+
+    def _buildAttributes(self):
         attributes = {}
         # store all formattedString settings in a custom attributes key
         attributes["drawBot.formattedString.properties"] = self.textProperties()
@@ -1401,7 +1722,8 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
             nsFontFeatures = []  # fallback for macOS < 10.13
             if self._openTypeFeatures:
                 # get existing openTypeFeatures for the font
-                existingOpenTypeFeatures = openType.getFeatureTagsForFont(font)
+                # the feature tags are memoized per font, test membership against a set
+                existingOpenTypeFeatures = set(openType.getFeatureTagsForFont(font))
                 # sort features by their on/off state
                 # set all disabled features first
                 orderedOpenTypeFeatures = sorted(self._openTypeFeatures.items(), key=lambda kv: kv[1])
@@ -1429,7 +1751,7 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
             fontAttributes = {}
             if coreTextFontFeatures:
                 fontAttributes[CoreText.kCTFontFeatureSettingsAttribute] = coreTextFontFeatures
-                if macOSVersion < Version("10.13"):
+                if _NSFONTFEATURESFALLBACK:
                     # fallback for macOS < 10.13:
                     fontAttributes[CoreText.NSFontFeatureSettingsAttribute] = nsFontFeatures
             if coreTextFontVariations:
@@ -1470,22 +1792,55 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
             # at 100 points. Our value should not scale with the font size, so we
             # compensate by multiplying by 100 and dividing by the font size.
             attributes[AppKit.NSStrokeWidthAttributeName] = -abs(100 * self._strokeWidth / self._fontSize)
+        if self._tracking is not None:
+            if _NSKERNTRACKINGFALLBACK:
+                attributes[AppKit.NSKernAttributeName] = self._tracking
+            else:
+                attributes[CoreText.kCTTrackingAttributeName] = self._tracking
+        if self._baselineShift is not None:
+            attributes[AppKit.NSBaselineOffsetAttributeName] = self._baselineShift
+        underline = self._textUnderlineMap.get(self._underline)
+        if underline is not None:
+            attributes[AppKit.NSUnderlineStyleAttributeName] = underline
+        strikethrough = self._textstrikethroughMap.get(self._strikethrough)
+        if strikethrough is not None:
+            attributes[AppKit.NSStrikethroughStyleAttributeName] = strikethrough
+        if self._url is not None:
+            attributes[AppKit.NSLinkAttributeName] = AppKit.NSURL.URLWithString_(self._url)
+        if self._language:
+            attributes["NSLanguage"] = self._language
+
+        attributes[AppKit.NSParagraphStyleAttributeName] = self._getParagraphStyle()
+        return attributes
+
+    def _getParagraphStyle(self):
+        # reuse the paragraph style as long as none of the paragraph settings changed
+        key = (
+            self._align,
+            _hashableValue(self._tabs),
+            self._lineHeight,
+            self._indent,
+            self._tailIndent,
+            self._firstLineIndent,
+            self._paragraphTopSpacing,
+            self._paragraphBottomSpacing,
+            self._writingDirection,
+        )
+        if key == self._paragraphStyleKey:
+            return self._paragraphStyle
         para = AppKit.NSMutableParagraphStyle.alloc().init()
         if self._align:
             para.setAlignment_(self._textAlignMap[self._align])
         if self._tabs:
-            for tabStop in para.tabStops():
-                para.removeTabStop_(tabStop)
-
-            if len(self._tabs) < 12:
-                self._tabs = list(self._tabs)
+            tabs = list(self._tabs)
+            if len(tabs) < 12:
                 # add tab stops if there is not enough stops...
                 # the default is 12 tabs, so lets add 12 in steps of 28
-                lastTabValue = self._tabs[-1][0]
-                for tabIndex in range(12 - len(self._tabs)):
-                    self._tabs.append((lastTabValue + 28 * (tabIndex + 1), "left"))
+                lastTabValue = tabs[-1][0]
+                tabs.extend((lastTabValue + 28 * (tabIndex + 1), "left") for tabIndex in range(12 - len(tabs)))
 
-            for tab, tabAlign in self._tabs:
+            tabStops = []
+            for tab, tabAlign in tabs:
                 tabOptions = None
                 if tabAlign in self._textTabAlignMap:
                     tabAlign = self._textTabAlignMap[tabAlign]
@@ -1494,7 +1849,9 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
                     tabOptions = {AppKit.NSTabColumnTerminatorsAttributeName: tabCharSet}
                     tabAlign = self._textAlignMap["right"]
                 tabStop = AppKit.NSTextTab.alloc().initWithTextAlignment_location_options_(tabAlign, tab, tabOptions)
-                para.addTabStop_(tabStop)
+                tabStops.append(tabStop)
+            # replace the default tab stops at once
+            para.setTabStops_(tabStops)
         if self._lineHeight is not None:
             # para.setLineSpacing_(0.0)
             # para.setLineHeightMultiple_(1)
@@ -1514,27 +1871,13 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         if self._paragraphBottomSpacing is not None:
             para.setParagraphSpacing_(self._paragraphBottomSpacing)
 
-        if self._tracking is not None:
-            if macOSVersion < Version("10.12"):
-                attributes[AppKit.NSKernAttributeName] = self._tracking
-            else:
-                attributes[CoreText.kCTTrackingAttributeName] = self._tracking
-        if self._baselineShift is not None:
-            attributes[AppKit.NSBaselineOffsetAttributeName] = self._baselineShift
-        if self._underline in self._textUnderlineMap:
-            attributes[AppKit.NSUnderlineStyleAttributeName] = self._textUnderlineMap[self._underline]
-        if self._strikethrough in self._textstrikethroughMap:
-            attributes[AppKit.NSStrikethroughStyleAttributeName] = self._textstrikethroughMap[self._strikethrough]
-        if self._url is not None:
-            attributes[AppKit.NSLinkAttributeName] = AppKit.NSURL.URLWithString_(self._url)
-        if self._language:
-            attributes["NSLanguage"] = self._language
-        if self._writingDirection in self._writingDirectionMap:
-            para.setBaseWritingDirection_(self._writingDirectionMap[self._writingDirection])
+        writingDirection = self._writingDirectionMap.get(self._writingDirection)
+        if writingDirection is not None:
+            para.setBaseWritingDirection_(writingDirection)
 
-        attributes[AppKit.NSParagraphStyleAttributeName] = para
-        txt = AppKit.NSAttributedString.alloc().initWithString_attributes_(txt, attributes)
-        self._attributedString.appendAttributedString_(txt)
+        self._paragraphStyleKey = key
+        self._paragraphStyle = para
+        return para
 
     def _getNSFontWithFallback(self):
         font = getNSFontFromNameOrPath(self._font, self._fontSize, self._fontNumber)
@@ -1631,6 +1974,9 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         The font name is returned, which is handy when the font was loaded
         from a path.
         """
+        if type(fontNameOrPath) is str:
+            # font names are used as keys in the memoized font lookups
+            fontNameOrPath = sys.intern(fontNameOrPath)
         self._font = fontNameOrPath
         if fontSize is not None:
             self._fontSize = fontSize
@@ -1647,11 +1993,13 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         If a font path is given the font will be installed and used directly.
         """
         fontName = None
+        if type(fontNameOrPath) is str:
+            fontNameOrPath = sys.intern(fontNameOrPath)
         if fontNameOrPath is not None:
             testFont = getNSFontFromNameOrPath(fontNameOrPath, 10, fontNumber)
             if testFont is None:
                 raise DrawBotError(f"Fallback font '{fontNameOrPath}' is not available")
-            fontName = getFontName(fontName)
+            fontName = getFontName(testFont)
         self._fallbackFont = fontNameOrPath
         self._fallbackFontNumber = fontNumber
         return fontName
@@ -1671,9 +2019,13 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         Sets the fill color with a `red`, `green`, `blue` and `alpha` value.
         Each argument must a value float between 0 and 1.
         """
+        fill: tuple[float, ...] | None
         if r is None:
             fill = None
+        elif g is not None and b is not None:
+            fill = r, g, b, 1 if alpha is None else alpha
         else:
+            # grey values, leave out the missing components
             fill = tuple([i for i in (r, g, b, alpha) if i is not None])
         self._fill = fill
         self._cmykFill = None
@@ -1683,9 +2035,13 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         Sets the stroke color with a `red`, `green`, `blue` and `alpha` value.
         Each argument must a value float between 0 and 1.
         """
+        stroke: tuple[float, ...] | None
         if r is None:
             stroke = None
+        elif g is not None and b is not None:
+            stroke = r, g, b, 1 if alpha is None else alpha
         else:
+            # grey values, leave out the missing components
             stroke = tuple([i for i in (r, g, b, alpha) if i is not None])
         self._stroke = stroke
         self._cmykStroke = None
@@ -1824,7 +2180,7 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
             if features.pop("resetFeatures", False):
                 self._openTypeFeatures.clear()
             self._openTypeFeatures.update(features)
-        return dict(self._openTypeFeatures)
+        return self._openTypeFeatures.copy()
 
     def listOpenTypeFeatures(self, fontNameOrPath: SomePath | None = None, fontNumber: int = 0) -> list[str]:
         """
@@ -1856,11 +2212,19 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
             if axes.pop("resetVariations", False):
                 self._fontVariations.clear()
             self._fontVariations.update(axes)
-        defaultVariations = self.listFontVariations()
-        currentVariation = {axis: data["defaultValue"] for axis, data in defaultVariations.items()}
+        currentVariation = self._getDefaultVariations().copy()
         currentVariation.update(self._fontVariations)
         return currentVariation
 
+    def _getDefaultVariations(self):
+        # reuse the default axis values as long as the font is not changed
+        key = (self._font,)
+        if key != self._defaultVariationsKey:
+            defaultVariations = self.listFontVariations()
+            self._defaultVariations = {axis: data["defaultValue"] for axis, data in defaultVariations.items()}
+            self._defaultVariationsKey = key
+        return self._defaultVariations
+
     def listFontVariations(self, fontNameOrPath: SomePath | None = None, fontNumber: int = 0) -> dict[str, dict]:
         """
         List all variation axes for the current font.
@@ -2038,6 +2402,9 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
 
         `language()` will activate the `locl` OpenType features, if supported by the current font.
         """
+        if language == self._language:
+            # already set and validated
+            return
         if language is not None and not validateLanguageCode(language):
             warnings.warn(f"Language '{language}' is not available.")
         self._language = language
@@ -2046,7 +2413,7 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         """
         Set the writing direction: `None`, `'LTR'` or `'RTL'`.
         """
-        if direction is not None and direction not in self._writingDirectionMap.keys():
+        if direction is not None and direction not in self._writingDirectionMap:
             raise DrawBotError("writing direction must be %s" % (", ".join(sorted(self._writingDirectionMap.keys()))))
         self._writingDirection = direction
 
@@ -2063,8 +2430,20 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         """
         Copy the formatted string.
         """
-        attributes = {key: getattr(self, "_%s" % key) for key in self._formattedAttributes}
-        new = self.__class__(**attributes)
+        # copy the current text properties directly,
+        # they are already validated and do not have to go through the setters again
+        new = self.__class__.__new__(self.__class__)
+        for privateName in self._formattedAttributeNames:
+            value = getattr(self, privateName)
+            if isinstance(value, (dict, list)):
+                value = value.copy()
+            setattr(new, privateName, value)
+        # the cached attributes only depend on the text properties, share them with the copy
+        new._attributesCache = OrderedDict(self._attributesCache)
+        new._paragraphStyleKey = self._paragraphStyleKey
+        new._paragraphStyle = self._paragraphStyle
+        new._defaultVariationsKey = self._defaultVariationsKey
+        new._defaultVariations = self._defaultVariations
         new._attributedString = self._attributedString.mutableCopy()
         new.copyContextProperties(self)
         return new
@@ -2077,11 +2456,7 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         font = self._getNSFontWithFallback()
         if font is None:
             return False
-        # Issue 524: we need to pass the number of UTF-16 characters or it won't work for
-        # characters > U+FFFF
-        count = len(characters.encode("utf-16-be")) // 2
-        result, glyphs = CoreText.CTFontGetGlyphsForCharacters(font, characters, None, count)
-        return result
+        return _fontContainsCharacters(font, characters)
 
     def fontContainsGlyph(self, glyphName: str) -> bool:
         font = self._getNSFontWithFallback()
@@ -2094,25 +2469,30 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         """
         Return the path to the file of the current font.
         """
+        path, _ = self._getFontFilePathAndFont()
+        return path
+
+    def _getFontFilePathAndFont(self):
         font = getNSFontFromNameOrPath(self._font, self._fontSize, self._fontNumber)
         if font is not None:
             url = CoreText.CTFontDescriptorCopyAttribute(font.fontDescriptor(), CoreText.kCTFontURLAttribute)
             if url is not None:
-                return url.path()
+                return url.path(), font
             elif os.path.exists(self._font):
                 # This happens for reloaded fonts: the font object can't
                 # know its file origin, because it was loaded from data.
-                return os.path.abspath(self._font)
+                return os.path.abspath(self._font), font
         warnings.warn("Cannot find the path to the font '%s'." % self._font)
-        return None
+        return None, font
 
     def fontFileFontNumber(self) -> int:
+        path, font = self._getFontFilePathAndFont()
+        return self._getFontFileFontNumber(path, font)
+
+    def _getFontFileFontNumber(self, path, font):
         fontNumber = 0
-        path = self.fontFilePath()
         if path is not None:
-            font = getNSFontFromNameOrPath(self._font, self._fontSize, self._fontNumber)
-            descriptors = getFontDescriptorsFromPath(path)
-            fontNames = [d.postscriptName() for d in descriptors]
+            fontNames = getFontPostscriptNamesFromPath(path)
             try:
                 fontNumber = fontNames.index(font.fontDescriptor().postscriptName())
             except ValueError:
@@ -2123,9 +2503,7 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         """
         Return a list of glyph names supported by the current font.
         """
-        from fontTools.ttLib import TTFont, TTLibError  # type: ignore
-
-        path = self.fontFilePath()
+        path, font = self._getFontFilePathAndFont()
         if path is None:
             return []
         # load the font with fontTools
@@ -2135,19 +2513,16 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
         fontNumber = None
         ext = os.path.splitext(path)[-1].lower()
         if ext in (".ttc", ".otc"):
-            fontNumber = self.fontFileFontNumber()
+            fontNumber = self._getFontFileFontNumber(path, font)
         elif ext == ".dfont":
-            res_name_or_index = self.fontFileFontNumber() + 1
-        try:
-            with TTFont(path, lazy=True, fontNumber=fontNumber, res_name_or_index=res_name_or_index) as fontToolsFont:
-                glyphNames = fontToolsFont.getGlyphOrder()
-        except TTLibError:
+            res_name_or_index = self._getFontFileFontNumber(path, font) + 1
+        # the modification time is part of the cache key, a changed font file is read again
+        modTime = os.stat(path).st_mtime
+        glyphNames = _getGlyphNamesFromPath(path, fontNumber, res_name_or_index, modTime)
+        if glyphNames is None:
             warnings.warn("Cannot read the font file for '%s' at the path '%s'" % (self._font, path))
             return []
-        # remove .notdef from glyph names
-        if ".notdef" in glyphNames:
-            glyphNames.remove(".notdef")
-        return glyphNames
+        return list(glyphNames)
 
     def fontAscender(self) -> float:
         """
@@ -2225,24 +2600,14 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
             # Default font
             font = AppKit.NSFont.fontWithName_size_(_FALLBACKFONT, self._fontSize)
 
-        # disable calt features, as this seems to be on by default
-        # for both the font stored in the nsGlyphInfo as in the replacement character
-        fontAttributes = {}
         coreTextFontVariations = variation.getFontVariationAttributes(font, self._fontVariations)
-        if coreTextFontVariations:
-            fontAttributes[CoreText.NSFontVariationAttribute] = coreTextFontVariations
-
-        fontAttributes[CoreText.kCTFontFeatureSettingsAttribute] = [
-            dict(CTFeatureOpenTypeTag="calt", CTFeatureOpenTypeValue=False)
-        ]
-        fontDescriptor = font.fontDescriptor()
-        fontDescriptor = fontDescriptor.fontDescriptorByAddingAttributes_(fontAttributes)
-        font = AppKit.NSFont.fontWithDescriptor_size_(fontDescriptor, self._fontSize)
+        font = _getCaltDisabledFont(font, self._fontSize, tuple(sorted(coreTextFontVariations.items())))
 
         fallbackFont = self._fallbackFont
         self._fallbackFont = None  # type: ignore
         _openTypeFeatures: dict[str, bool] = dict(self._openTypeFeatures)
         self._openTypeFeatures = dict(calt=False)
+        glyphInfos = []
         for glyphName in glyphNames:
             if isinstance(glyphName, int):
                 # glyphName is a glyph ID
@@ -2250,14 +2615,10 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
             else:
                 glyph = font.glyphWithName_(glyphName)
             if glyph:
-                self.append(baseString)
                 glyphInfo = AppKit.NSGlyphInfo.glyphInfoWithGlyph_forFont_baseString_(glyph, font, baseString)
-                if glyphInfo is not None:
-                    self._attributedString.addAttribute_value_range_(
-                        AppKit.NSGlyphInfoAttributeName, glyphInfo, (len(self) - 1, 1)
-                    )
-                else:
+                if glyphInfo is None:
                     warnings.warn(f"font '{font.fontName()}' has no glyph with glyph ID {glyph}")
+                glyphInfos.append(glyphInfo)
             else:
                 if isinstance(glyphName, int) or glyphName == ".notdef":
                     message = "skipping '.notdef' glyph (glyph ID 0)"
@@ -2265,6 +2626,19 @@ class FormattedString(SVGContextPropertyMixin, ContextPropertyMixin):
                     message = "font '{fontName}' has no glyph with the name '{glyphName}'"
                 warnings.warn(message.format(fontName=font.fontName(), glyphName=glyphName))
 
+        if glyphInfos:
+            # append all replacement characters at once and set the glyph info for each of them
+            location = len(self)
+            self.append(baseString * len(glyphInfos))
+            attributedString = self._attributedString
+            attributedString.beginEditing()
+            for index, glyphInfo in enumerate(glyphInfos):
+                if glyphInfo is not None:
+                    attributedString.addAttribute_value_range_(
+                        AppKit.NSGlyphInfoAttributeName, glyphInfo, (location + index, 1)
+                    )
+            attributedString.endEditing()
+
         self.openTypeFeatures(**_openTypeFeatures)
         self._fallbackFont = fallbackFont
 
@@ -2273,12 +2647,40 @@ class GraphicsState:
     _textClass = FormattedString
     _colorClass = Color
 
+    __slots__ = (
+        "colorSpace",
+        "blendMode",
+        "opacity",
+        "fillColor",
+        "strokeColor",
+        # the arguments of the last fill() and stroke() call, None when unknown
+        "fillArguments",
+        "strokeArguments",
+        "cmykFillColor",
+        "cmykStrokeColor",
+        "shadow",
+        "gradient",
+        "strokeWidth",
+        "lineDash",
+        "lineDashOffset",
+        "lineCap",
+        "lineJoin",
+        "miterLimit",
+        "text",
+        "hyphenation",
+        "path",
+        # temporarily set by the pdf context while drawing a shadow behind a gradient
+        "cmykColor",
+    )
+
     def __init__(self):
         self.colorSpace = self._colorClass.colorSpace
         self.blendMode = None
         self.opacity = 1
         self.fillColor = self._colorClass(0)
         self.strokeColor = None
+        self.fillArguments = None
+        self.strokeArguments = None
         self.cmykFillColor = None
         self.cmykStrokeColor = None
         self.shadow = None
@@ -2294,32 +2696,29 @@ class GraphicsState:
         self.path = None
 
     def copy(self):
-        new = self.__class__()
+        # all attributes are set below, skip __init__ and the default color and text objects it creates
+        new = self.__class__.__new__(self.__class__)
         new.colorSpace = self.colorSpace
         new.blendMode = self.blendMode
         new.opacity = self.opacity
-        if self.fillColor is not None:
-            new.fillColor = self.fillColor.copy()
-        else:
-            new.fillColor = None
-        if self.strokeColor:
-            new.strokeColor = self.strokeColor.copy()
-        if self.cmykFillColor:
-            new.cmykFillColor = self.cmykFillColor.copy()
-        if self.cmykStrokeColor:
-            new.cmykStrokeColor = self.cmykStrokeColor.copy()
-        if self.shadow:
-            new.shadow = self.shadow.copy()
-        if self.gradient:
-            new.gradient = self.gradient.copy()
+        # colors, shadows, gradients and line dashes are never changed in place,
+        # they are replaced when set, so the copy can share them
+        new.fillColor = self.fillColor
+        new.strokeColor = self.strokeColor
+        new.fillArguments = self.fillArguments
+        new.strokeArguments = self.strokeArguments
+        new.cmykFillColor = self.cmykFillColor
+        new.cmykStrokeColor = self.cmykStrokeColor
+        new.shadow = self.shadow
+        new.gradient = self.gradient
+        new.path = None
         if self.path is not None:
             new.path = self.path.copy()
         new.text = self.text.copy()
         new.hyphenation = self.hyphenation
         new.strokeWidth = self.strokeWidth
         new.lineCap = self.lineCap
-        if self.lineDash is not None:
-            new.lineDash = list(self.lineDash)
+        new.lineDash = self.lineDash
         new.lineDashOffset = self.lineDashOffset
         new.lineJoin = self.lineJoin
         new.miterLimit = self.miterLimit
@@ -2400,6 +2799,8 @@ class BaseContext:
 
     _softHypen = 0x00AD
 
+    _attributedStringCacheSize = 64
+
     def __init__(self):
         self.width = None
         self.height = None
@@ -2464,6 +2865,7 @@ class BaseContext:
     def reset(self):
         self._stack = []
         self._state = self._graphicsStateClass()
+        self._attributedStringCache = OrderedDict()
         self._colorClass.colorSpace = self._colorSpaceMap["genericRGB"]
         self._reset()
 
@@ -2513,6 +2915,16 @@ class BaseContext:
         path.oval(x, y, w, h)
         self.drawPath(path)
 
+    def line(self, point1, point2):
+        path = self._bezierPathClass()
+        path.line(point1, point2)
+        self.drawPath(path)
+
+    def polygon(self, *points, close=True):
+        path = self._bezierPathClass()
+        path.polygon(*points, close=close)
+        self.drawPath(path)
+
     def newPath(self):
         self._state.path = self._bezierPathClass()
 
@@ -2524,6 +2936,11 @@ class BaseContext:
     def lineTo(self, pt):
         self._state.path.lineTo(pt)
 
+    def _lineToPoints(self, points):
+        # a run of lineTo calls, recorded as a single instruction
+        for pt in points:
+            self.lineTo(pt)
+
     def curveTo(self, pt1, pt2, pt):
         self._state.path.curveTo(pt1, pt2, pt)
 
@@ -2552,13 +2969,13 @@ class BaseContext:
     def colorSpace(self, colorSpace):
         if colorSpace is None:
             colorSpace = "genericRGB"
-        if colorSpace not in self._colorSpaceMap:
+        nsColorSpace = self._colorSpaceMap.get(colorSpace)
+        if nsColorSpace is None:
             raise DrawBotError(
                 "'%s' is not a valid colorSpace, argument must be '%s'"
                 % (colorSpace, "', '".join(self._colorSpaceMap.keys()))
             )
-        colorSpace = self._colorSpaceMap[colorSpace]
-        self._state.setColorSpace(colorSpace)
+        self._state.setColorSpace(nsColorSpace)
 
     def blendMode(self, operation):
         self._state.blendMode = operation
@@ -2569,6 +2986,11 @@ class BaseContext:
         self._opacity(value)
 
     def fill(self, r, g=None, b=None, a=1):
+        # scripts often set the same fill again for every shape
+        fillArguments = (r, g, b, a, self._colorClass.colorSpace)
+        if fillArguments == self._state.fillArguments:
+            return
+        self._state.fillArguments = fillArguments
         self._state.text.fill(r, g, b, a)
         self._state.cmykFillColor = None
         if r is None:
@@ -2582,12 +3004,17 @@ class BaseContext:
         if c is None:
             self.fill(None)
         else:
+            self._state.fillArguments = None
             self._state.cmykFillColor = self._cmykColorClass(c, m, y, k, a)
-            r, g, b = cmyk2rgb(c, m, y, k)
+            r, g, b = _cachedCmyk2rgb(c, m, y, k)
             self._state.fillColor = self._colorClass(r, g, b, a)
             self._state.gradient = None
 
     def stroke(self, r, g=None, b=None, a=1):
+        strokeArguments = (r, g, b, a, self._colorClass.colorSpace)
+        if strokeArguments == self._state.strokeArguments:
+            return
+        self._state.strokeArguments = strokeArguments
         self._state.text.stroke(r, g, b, a)
         self._state.cmykStrokeColor = None
         if r is None:
@@ -2600,8 +3027,9 @@ class BaseContext:
         if c is None:
             self.stroke(None)
         else:
+            self._state.strokeArguments = None
             self._state.cmykStrokeColor = self._cmykColorClass(c, m, y, k, a)
-            r, g, b = cmyk2rgb(c, m, y, k)
+            r, g, b = _cachedCmyk2rgb(c, m, y, k)
             self._state.strokeColor = self._colorClass(r, g, b, a)
 
     def shadow(self, offset, blur, color):
@@ -2614,10 +3042,19 @@ class BaseContext:
         if offset is None:
             self._state.shadow = None
             return
-        rgbColor = cmyk2rgb(color[0], color[1], color[2], color[3])
+        rgbColor = _cachedCmyk2rgb(color[0], color[1], color[2], color[3])
         self._state.shadow = self._shadowClass(offset, blur, rgbColor)
         self._state.shadow.cmykColor = self._cmykColorClass(*color)
 
+    def _convertCMYKGradientColors(self, colors):
+        # convert all gradient stops in a single pass
+        rgbColors = []
+        cmykColors = []
+        for color in colors:
+            rgbColors.append(_cachedCmyk2rgb(color[0], color[1], color[2], color[3]))
+            cmykColors.append(self._cmykColorClass(*color))
+        return rgbColors, cmykColors
+
     def linearGradient(self, startPoint=None, endPoint=None, colors=None, locations=None):
         if startPoint is None:
             self._state.gradient = None
@@ -2631,9 +3068,9 @@ class BaseContext:
             self._state.gradient = None
             self.fill(0)
             return
-        rgbColors = [cmyk2rgb(color[0], color[1], color[2], color[3]) for color in colors]
+        rgbColors, cmykColors = self._convertCMYKGradientColors(colors)
         self._state.gradient = self._gradientClass("linear", startPoint, endPoint, rgbColors, locations)
-        self._state.gradient.cmykColors = [self._cmykColorClass(*color) for color in colors]
+        self._state.gradient.cmykColors = cmykColors
         self.fill(None)
 
     def radialGradient(self, startPoint=None, endPoint=None, colors=None, locations=None, startRadius=0, endRadius=100):
@@ -2653,11 +3090,11 @@ class BaseContext:
             self._state.gradient = None
             self.fill(0)
             return
-        rgbColors = [cmyk2rgb(color[0], color[1], color[2], color[3]) for color in colors]
+        rgbColors, cmykColors = self._convertCMYKGradientColors(colors)
         self._state.gradient = self._gradientClass(
             "radial", startPoint, endPoint, rgbColors, locations, startRadius, endRadius
         )
-        self._state.gradient.cmykColors = [self._cmykColorClass(*color) for color in colors]
+        self._state.gradient.cmykColors = cmykColors
         self.fill(None)
 
     def strokeWidth(self, value):
@@ -2670,22 +3107,26 @@ class BaseContext:
     def lineJoin(self, join):
         if join is None:
             self._state.lineJoin = None
-        if join not in _LINEJOINSTYLESMAP:
+            return
+        try:
+            self._state.lineJoin = _LINEJOINSTYLESMAP[join]
+        except KeyError:
             raise DrawBotError("lineJoin() argument must be 'bevel', 'miter' or 'round'")
-        self._state.lineJoin = _LINEJOINSTYLESMAP[join]
 
     def lineCap(self, cap):
         if cap is None:
             self._state.lineCap = None
-        if cap not in _LINECAPSTYLESMAP:
+            return
+        try:
+            self._state.lineCap = _LINECAPSTYLESMAP[cap]
+        except KeyError:
             raise DrawBotError("lineCap() argument must be 'butt', 'square' or 'round'")
-        self._state.lineCap = _LINECAPSTYLESMAP[cap]
 
     def lineDash(self, dash, offset):
         if dash[0] is None:
             self._state.lineDash = None
             return
-        self._state.lineDash = list(dash)
+        self._state.lineDash = tuple(dash)
         self._state.lineDashOffset = offset
 
     def transform(self, matrix):
@@ -2742,101 +3183,53 @@ class BaseContext:
     def attributedString(self, txt, align=None):
         if isinstance(txt, FormattedString):
             return txt.getNSObject()
-        self._state.text.clear()
-        self._state.text.append(txt, align=align)
-        return self._state.text.getNSObject()
+        text = self._state.text
+        if not isinstance(txt, str):
+            text.clear()
+            text.append(txt, align=align)
+            return text.getNSObject()
+        # the alignment only applies to this text, leave the alignment of the text state untouched
+        previousAlign = text._align
+        text.align(align)
+        try:
+            styleKey = text._styleKey()
+            if styleKey is None:
+                text.clear()
+                text.append(txt)
+                return text.getNSObject()
+            # the same text is often set again with the same settings, for example in every frame of an animation
+            key = styleKey, txt
+            attributedString = self._attributedStringCache.get(key)
+            if attributedString is None:
+                text.clear()
+                text.append(txt)
+                # cache an immutable copy, the text state keeps appending to its own attributed string
+                attributedString = text.getNSObject().copy()
+                self._attributedStringCache[key] = attributedString
+                if len(self._attributedStringCache) > self._attributedStringCacheSize:
+                    self._attributedStringCache.popitem(last=False)
+            else:
+                self._attributedStringCache.move_to_end(key)
+            return attributedString
+        finally:
+            text.align(previousAlign)
 
     def hyphenateAttributedString(self, attrString, path):
-        # add soft hyphens
-        attrString = attrString.mutableCopy()
-        mutString = attrString.mutableString()
-        wordRange = AppKit.NSMakeRange(mutString.length(), 0)
-        while wordRange.location > 2:
-            wordRange = attrString.doubleClickAtIndex_(wordRange.location - 2)
-            hyphenIndex = AppKit.NSMaxRange(wordRange)
-            while hyphenIndex != AppKit.NSNotFound:
-                hyphenIndex = attrString.lineBreakByHyphenatingBeforeIndex_withinRange_(hyphenIndex, wordRange)
-                if hyphenIndex != AppKit.NSNotFound:
-                    mutString.insertString_atIndex_(chr(self._softHypen), hyphenIndex)
-
-        # get the lines
-        lines = self._getTypesetterLinesWithPath(attrString, path)
-        # get all lines justified
-        justifiedLines = self._getTypesetterLinesWithPath(self._justifyAttributedString(attrString), path)
-
-        # loop over all lines
-        i = 0
-        while i < len(lines):
-            # get the current line
-            line = lines[i]
-            # get the range in the text for the current line
-            rng = CoreText.CTLineGetStringRange(line)
-            # get the substring from the range
-            subString = attrString.attributedSubstringFromRange_(rng)
-            # get the string
-            subStringText = subString.string()
-            # check if the line ends with a softhypen
-            if len(subStringText) and subStringText[-1] == chr(self._softHypen):
-                # here we go
-                # get the justified line and get the max line width
-                maxLineWidth, _, _, _ = CoreText.CTLineGetTypographicBounds(justifiedLines[i], None, None, None)
-                # get the last attributes
-                hyphenAttr, _ = subString.attributesAtIndex_effectiveRange_(0, None)
-                # create a hyphen string
-                hyphenAttrString = AppKit.NSAttributedString.alloc().initWithString_attributes_("-", hyphenAttr)
-                # get the width of the hyphen
-                hyphenWidth = hyphenAttrString.size().width
-                # get all line break location of that line
-                lineBreakLocation = len(subString)
-                possibleLineBreaks = [lineBreakLocation]
-                while lineBreakLocation:
-                    lineBreakLocation = subString.lineBreakBeforeIndex_withinRange_(
-                        lineBreakLocation, (0, len(subString))
-                    )
-                    if lineBreakLocation:
-                        possibleLineBreaks.append(lineBreakLocation)
-                breakFound = False
-                # loop over all possible line breaks
-                while possibleLineBreaks:
-                    lineBreak = possibleLineBreaks.pop(0)
-                    # get a possible line
-                    breakString = subString.attributedSubstringFromRange_((0, lineBreak))
-                    # get the width
-                    stringWidth = breakString.size().width
-                    # add hyphen width if required
-                    if breakString.string()[-1] == chr(self._softHypen):
-                        stringWidth += hyphenWidth
-                    # found a break
-                    if stringWidth <= maxLineWidth:
-                        breakFound = True
-                        break
-
-                if breakFound and len(breakString.string()) > 2 and breakString.string()[-1] == chr(self._softHypen):
-                    # if the break line ends with a soft hyphen
-                    # add a hyphen
-                    attrString.replaceCharactersInRange_withString_((rng.location + lineBreak, 0), "-")
-                # remove all soft hyphens for the range of that line
-                mutString.replaceOccurrencesOfString_withString_options_range_(
-                    chr(self._softHypen), "", AppKit.NSLiteralSearch, rng
-                )
-                # reset the lines, from the adjusted attribute string
-                lines = self._getTypesetterLinesWithPath(attrString, path)
-                # reset the justifed lines form the adjusted attributed string
-                justifiedLines = self._getTypesetterLinesWithPath(self._justifyAttributedString(attrString), path)
-            # next line
-            i += 1
-        # remove all soft hyphen
-        mutString.replaceOccurrencesOfString_withString_options_range_(
-            chr(self._softHypen), "", AppKit.NSLiteralSearch, (0, mutString.length())
-        )
-        # done!
-        return attrString
+        # memoize with an immutable copy, the given attributed string could be changed later on
+        # and hand out a copy, the memoized attributed string is shared
+        return _hyphenateAttributedString(attrString.copy(), path, chr(self._softHypen)).mutableCopy()
 
     def clippedText(self, txt, box, align):
         path, origin = self._getPathForFrameSetter(box)
         attrString = self.attributedString(txt, align=align)
         if self._state.hyphenation:
-            hyphenIndexes = [i for i, c in enumerate(attrString.string()) if c == "-"]
+            text = str(attrString.string())
+            # store each hyphen index minus the number of hyphens before it, this keeps the list sorted
+            hyphenIndexes = []
+            hyphenIndex = text.find("-")
+            while hyphenIndex != -1:
+                hyphenIndexes.append(hyphenIndex - len(hyphenIndexes))
+                hyphenIndex = text.find("-", hyphenIndex + 1)
             attrString = self.hyphenateAttributedString(attrString, path)
         setter = newFramesetterWithAttributedString(attrString)
         box = CoreText.CTFramesetterCreateFrame(setter, (0, 0), path, None)
@@ -2844,36 +3237,11 @@ class BaseContext:
         clip = visibleRange.length
         if self._state.hyphenation:
             subString = attrString.string()[:clip]
-            for i in hyphenIndexes:
-                if i < clip:
-                    clip += 1
-                else:
-                    break
+            # each hyphen before the clip moves the clip one character further
+            clip += bisect.bisect_left(hyphenIndexes, clip)
             clip -= subString.count("-")
         return txt[clip:]
 
-    def _justifyAttributedString(self, attr):
-        # create a justified copy of the attributed string
-        attr = attr.mutableCopy()
-
-        def changeParaAttribute(para, rng, _):
-            para = para.mutableCopy()
-            para.setAlignment_(AppKit.NSJustifiedTextAlignment)
-            attr.addAttribute_value_range_(AppKit.NSParagraphStyleAttributeName, para, rng)
-
-        attr.enumerateAttribute_inRange_options_usingBlock_(
-            AppKit.NSParagraphStyleAttributeName, (0, len(attr)), 0, changeParaAttribute
-        )
-        return attr
-
-    def _getTypesetterLinesWithPath(self, attrString, path, offset=None):
-        # get lines for an attribute string with a given path
-        if offset is None:
-            offset = 0, 0
-        setter = newFramesetterWithAttributedString(attrString)
-        frame = CoreText.CTFramesetterCreateFrame(setter, offset, path, None)
-        return CoreText.CTFrameGetLines(frame)
-
     def _getPathForFrameSetter(self, box):
         if isinstance(box, self._bezierPathClass):
             path = box._getCGPath()
@@ -2886,8 +3254,7 @@ class BaseContext:
             if h < 0:
                 y += h
                 h = -h
-            path = CoreText.CGPathCreateMutable()
-            CoreText.CGPathAddRect(path, None, CoreText.CGRectMake(x, y, w, h))
+            path = _getRectCGPath(x, y, w, h)
         return path, (x, y)
 
     def textSize(self, txt, align, width, height):
@@ -2900,8 +3267,7 @@ class BaseContext:
             if height is None:
                 height = CoreText.CGFLOAT_MAX
             if self._state.hyphenation:
-                path = CoreText.CGPathCreateMutable()
-                CoreText.CGPathAddRect(path, None, CoreText.CGRectMake(0, 0, width, height))
+                path = _getRectCGPath(0, 0, width, height)
                 attrString = self.hyphenateAttributedString(attrString, path)
             setter = newFramesetterWithAttributedString(attrString)
             (w, h), _ = CoreText.CTFramesetterSuggestFrameSizeWithConstraints(
@@ -2932,7 +3298,7 @@ class BaseContext:
         return success, error
 
     def _fontNameForPath(self, path):
-        from fontTools.ttLib import TTFont, TTLibError
+        from fontTools.ttLib import TTFont, TTLibError  # type: ignore
 
         try:
             font = TTFont(path, fontNumber=0)  # in case of .ttc, use the first font
@@ -2961,6 +3327,122 @@ class BaseContext:
         self._linkRect(name, (x, y, w, h))
 
 
+@memoize
+def _hyphenateAttributedString(attrString, path, softHyphen):
+    # the hyphenated string only depends on the text and the path, textBox hyphenates the same text twice:
+    # once for the text overflow and once for drawing
+    # add soft hyphens
+    attrString = attrString.mutableCopy()
+    mutString = attrString.mutableString()
+    notFound = AppKit.NSNotFound
+    maxRange = AppKit.NSMaxRange
+    hasSoftHyphens = False
+    wordRange = AppKit.NSMakeRange(mutString.length(), 0)
+    while wordRange.location > 2:
+        wordRange = attrString.doubleClickAtIndex_(wordRange.location - 2)
+        hyphenIndex = maxRange(wordRange)
+        while hyphenIndex != notFound:
+            hyphenIndex = attrString.lineBreakByHyphenatingBeforeIndex_withinRange_(hyphenIndex, wordRange)
+            if hyphenIndex != notFound:
+                mutString.insertString_atIndex_(softHyphen, hyphenIndex)
+                hasSoftHyphens = True
+    if not hasSoftHyphens:
+        # no hyphenation points, no need to typeset the lines
+        return attrString
+
+    # get the lines
+    lines = _getTypesetterLinesWithPath(attrString, path)
+    # the justified lines are only typeset when a line ends with a soft hyphen
+    justifiedLines = None
+
+    # loop over all lines
+    i = 0
+    while i < len(lines):
+        # get the current line
+        line = lines[i]
+        # get the range in the text for the current line
+        rng = CoreText.CTLineGetStringRange(line)
+        # get the substring from the range
+        subString = attrString.attributedSubstringFromRange_(rng)
+        # get the string
+        subStringText = subString.string()
+        # check if the line ends with a softhypen
+        if len(subStringText) and subStringText[-1] == softHyphen:
+            # here we go
+            if justifiedLines is None:
+                # get all lines justified
+                justifiedLines = _getTypesetterLinesWithPath(_justifyAttributedString(attrString), path)
+            # get the justified line and get the max line width
+            maxLineWidth, _, _, _ = CoreText.CTLineGetTypographicBounds(justifiedLines[i], None, None, None)
+            # get the last attributes
+            hyphenAttr, _ = subString.attributesAtIndex_effectiveRange_(0, None)
+            # create a hyphen string
+            hyphenAttrString = AppKit.NSAttributedString.alloc().initWithString_attributes_("-", hyphenAttr)
+            # get the width of the hyphen
+            hyphenWidth = hyphenAttrString.size().width
+            # loop over all possible line breaks of that line, from the end to the start
+            lineBreak = len(subString)
+            subStringRange = (0, lineBreak)
+            breakFound = False
+            while lineBreak:
+                # get a possible line
+                breakString = subString.attributedSubstringFromRange_((0, lineBreak))
+                # get the width
+                stringWidth = breakString.size().width
+                # add hyphen width if required
+                if breakString.string()[-1] == softHyphen:
+                    stringWidth += hyphenWidth
+                # found a break
+                if stringWidth <= maxLineWidth:
+                    breakFound = True
+                    break
+                # get the previous line break location
+                lineBreak = subString.lineBreakBeforeIndex_withinRange_(lineBreak, subStringRange)
+
+            if breakFound and len(breakString.string()) > 2 and breakString.string()[-1] == softHyphen:
+                # if the break line ends with a soft hyphen
+                # add a hyphen
+                attrString.replaceCharactersInRange_withString_((rng.location + lineBreak, 0), "-")
+            # remove all soft hyphens for the range of that line
+            mutString.replaceOccurrencesOfString_withString_options_range_(softHyphen, "", AppKit.NSLiteralSearch, rng)
+            # reset the lines, from the adjusted attribute string
+            lines = _getTypesetterLinesWithPath(attrString, path)
+            # the justified lines are typeset again from the adjusted attributed string when needed
+            justifiedLines = None
+        # next line
+        i += 1
+    # remove all soft hyphen
+    mutString.replaceOccurrencesOfString_withString_options_range_(
+        softHyphen, "", AppKit.NSLiteralSearch, (0, mutString.length())
+    )
+    # done!
+    return attrString
+
+
+def _justifyAttributedString(attr):
+    # create a justified copy of the attributed string
+    attr = attr.mutableCopy()
+
+    def changeParaAttribute(para, rng, _):
+        para = para.mutableCopy()
+        para.setAlignment_(AppKit.NSJustifiedTextAlignment)
+        attr.addAttribute_value_range_(AppKit.NSParagraphStyleAttributeName, para, rng)
+
+    attr.enumerateAttribute_inRange_options_usingBlock_(
+        AppKit.NSParagraphStyleAttributeName, (0, len(attr)), 0, changeParaAttribute
+    )
+    return attr
+
+
+def _getTypesetterLinesWithPath(attrString, path, offset=None):
+    # get lines for an attribute string with a given path
+    if offset is None:
+        offset = 0, 0
+    setter = newFramesetterWithAttributedString(attrString)
+    frame = CoreText.CTFramesetterCreateFrame(setter, offset, path, None)
+    return CoreText.CTFrameGetLines(frame)
+
+
 @memoize
 def getNSFontFromNameOrPath(fontNameOrPath, fontSize, fontNumber):
     if not isinstance(fontNameOrPath, (str, os.PathLike)):
@@ -2981,9 +3463,18 @@ def _getNSFontFromNameOrPath(fontNameOrPath, fontSize, fontNumber):
         if nsFont is not None:
             return nsFont
     # load from path
-    if not os.path.exists(fontNameOrPath):
+    descriptor = _getFontDescriptorFromPath(fontNameOrPath, fontNumber)
+    if descriptor is None:
         return None
-    fontPath = os.path.abspath(fontNameOrPath)
+    return CoreText.CTFontCreateWithFontDescriptor(descriptor, fontSize, None)
+
+
+@memoize
+def _getFontDescriptorFromPath(fontPath, fontNumber):
+    # resolve the descriptor once for all font sizes
+    if not os.path.exists(fontPath):
+        return None
+    fontPath = os.path.abspath(fontPath)
     descriptors = getFontDescriptorsFromPath(fontPath)
     if not descriptors:
         return None
@@ -2991,7 +3482,7 @@ def _getNSFontFromNameOrPath(fontNameOrPath, fontSize, fontNumber):
         raise IndexError(
             f"fontNumber out of range for '{fontPath}': {fontNumber} not in range 0..{len(descriptors) - 1}"
         )
-    return CoreText.CTFontCreateWithFontDescriptor(descriptors[fontNumber], fontSize, None)
+    return descriptors[fontNumber]
 
 
 #
@@ -3036,6 +3527,53 @@ def getFontDescriptorsFromPath(fontPath):
     return descriptors
 
 
+@memoize
+def getFontPostscriptNamesFromPath(fontPath):
+    return [descriptor.postscriptName() for descriptor in getFontDescriptorsFromPath(fontPath)]
+
+
+@memoize
+def _getCaltDisabledFont(font, fontSize, coreTextFontVariations):
+    # disable calt features, as this seems to be on by default
+    # for both the font stored in the nsGlyphInfo as in the replacement character
+    fontAttributes = {}
+    if coreTextFontVariations:
+        fontAttributes[CoreText.NSFontVariationAttribute] = dict(coreTextFontVariations)
+
+    fontAttributes[CoreText.kCTFontFeatureSettingsAttribute] = [
+        dict(CTFeatureOpenTypeTag="calt", CTFeatureOpenTypeValue=False)
+    ]
+    fontDescriptor = font.fontDescriptor()
+    fontDescriptor = fontDescriptor.fontDescriptorByAddingAttributes_(fontAttributes)
+    return AppKit.NSFont.fontWithDescriptor_size_(fontDescriptor, fontSize)
+
+
+@memoize
+def _fontContainsCharacters(font, characters):
+    # Issue 524: we need to pass the number of UTF-16 characters or it won't work for
+    # characters > U+FFFF
+    if not characters or max(characters) <= "\uffff":
+        # only BMP characters, each one is a single UTF-16 code unit
+        count = len(characters)
+    else:
+        count = len(characters.encode("utf-16-be")) // 2
+    result, glyphs = CoreText.CTFontGetGlyphsForCharacters(font, characters, None, count)
+    return result
+
+
+@memoize
+def _getGlyphNamesFromPath(path, fontNumber, res_name_or_index, modTime):
+    from fontTools.ttLib import TTFont, TTLibError  # type: ignore
+
+    try:
+        with TTFont(path, lazy=True, fontNumber=fontNumber, res_name_or_index=res_name_or_index) as fontToolsFont:
+            glyphNames = fontToolsFont.getGlyphOrder()
+    except TTLibError:
+        return None
+    # remove .notdef from glyph names
+    return tuple(glyphName for glyphName in glyphNames if glyphName != ".notdef")
+
+
 def getFontName(font) -> str | None:
     if font is None:
         return None
@@ -3045,11 +3583,18 @@ def getFontName(font) -> str | None:
     return fontName
 
 
+if _CTTYPESETTEROPTIONS:
+    _typesetterOptions = {
+        allowUnbounded: {CoreText.kCTTypesetterOptionAllowUnboundedLayout: allowUnbounded}
+        for allowUnbounded in (False, True)
+    }
+
+
 def newFramesetterWithAttributedString(attrString):
-    if macOSVersion >= Version("10.14"):
+    if _CTTYPESETTEROPTIONS:
         allowUnbounded = len(attrString) > 2000  # somewhat arbitrary
         typesetter = CoreText.CTTypesetterCreateWithAttributedStringAndOptions(
-            attrString, {CoreText.kCTTypesetterOptionAllowUnboundedLayout: allowUnbounded}
+            attrString, _typesetterOptions[allowUnbounded]
         )
         return CoreText.CTFramesetterCreateWithTypesetter(typesetter)
     else:
@@ -319,7 +319,7 @@ class PDFContext(BaseContext):
     # helpers
 
     def _pdfPath(self, path):
-        path = path.getNSBezierPath()
+        path = path._path
         for i in range(path.elementCount()):
             instruction, points = path.elementAtIndex_associatedPoints_(i)
             if instruction == AppKit.NSMoveToBezierPathElement:
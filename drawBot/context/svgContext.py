@@ -215,6 +215,8 @@ class SVGShadow(Shadow):
 class SVGGraphicsState(GraphicsState):
     _colorClass = SVGColor
 
+    __slots__ = ("transformMatrix", "clipPathID")
+
     def __init__(self):
         super(SVGGraphicsState, self).__init__()
         self.transformMatrix = Transform(1, 0, 0, 1, 0, 0)
@@ -600,7 +602,7 @@ class SVGContext(BaseContext):
         return "matrix(%s)" % (",".join([repr(s) for s in transform]))
 
     def _svgPath(self, path, transformMatrix=None):
-        path = path.getNSBezierPath()
+        path = path._path
         if transformMatrix:
             path = path.copy()
             aT = AppKit.NSAffineTransform.transform()
@@ -41,7 +41,14 @@ def getFeatureTagsForFont(font):
     psFontName = CoreText.CTFontDescriptorCopyAttribute(fontDescriptor, CoreText.kCTFontNameAttribute)
     if url is None or psFontName is None:
         return featureTags
-    path = url.path()
+    # the feature tags do not depend on the font size,
+    # read the font tables once for each font in a file
+    return _getFeatureTagsForFontFile(url.path(), psFontName)
+
+
+@memoize
+def _getFeatureTagsForFontFile(path, psFontName):
+    featureTags = []
     ext = os.path.splitext(path)[1].lower()
     macType = getMacCreatorAndType(path)[1]
     if ext in (".ttc", ".otc"):
@@ -3,7 +3,8 @@ import os
 import random
 from collections import namedtuple
 from contextlib import contextmanager
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import AppKit  # type: ignore
 import CoreText  # type: ignore
@@ -55,6 +56,17 @@ def _getmodulecontents(module, names=None):
     return d
 
 
+_noKeywordArguments: Mapping[str, Any] = MappingProxyType({})
+
+
+# the module contents added to every script namespace, these never change
+_moduleNamespace = {
+    **_getmodulecontents(random, ["random", "randint", "choice", "shuffle"]),
+    **_getmodulecontents(math),
+    **_getmodulecontents(drawBotbuiltins),
+}
+
+
 _paperSizes = {
     "Letter": (612, 792),
     "LetterSmall": (612, 792),
@@ -77,8 +89,17 @@ _paperSizes = {
     "10x14": (720, 1008),
 }
 
-for key, (w, h) in list(_paperSizes.items()):
-    _paperSizes["%sLandscape" % key] = (h, w)
+_paperSizes.update({f"{key}Landscape": (h, w) for key, (w, h) in _paperSizes.items()})
+
+
+def _resolvePaperSize(width, height):
+    # numeric sizes, the common case, skip the paper size lookups
+    if isinstance(width, str):
+        if width in _paperSizes:
+            return _paperSizes[width]
+        if width == "screen":
+            return AppKit.NSScreen.mainScreen().frame().size
+    return width, height
 
 
 class DrawBotDrawingTool:
@@ -104,9 +125,7 @@ class DrawBotDrawingTool:
 
     def _addToNamespace(self, namespace):
         namespace.update(_getmodulecontents(self, self.__all__))
-        namespace.update(_getmodulecontents(random, ["random", "randint", "choice", "shuffle"]))
-        namespace.update(_getmodulecontents(math))
-        namespace.update(_getmodulecontents(drawBotbuiltins))
+        namespace.update(_moduleNamespace)
         namespace["FormattedString"] = FormattedString
         namespace["BezierPath"] = BezierPath
         namespace["ImageObject"] = ImageObject
@@ -116,18 +135,34 @@ class DrawBotDrawingTool:
             self._instructionsStack.append([])
         if not self._instructionsStack:
             self._instructionsStack.append([])
-        if self._requiresNewFirstPage and not self._hasPage:
+        # once the first page exists this is the only check made per instruction
+        if not self._hasPage and self._requiresNewFirstPage:
             self._hasPage = True
-            self._instructionsStack[-1].insert(0, ("newPage", [self.width(), self.height()], {}))
-        self._instructionsStack[-1].append((callback, args, kwargs))
+            self._instructionsStack[-1].insert(0, ("newPage", [self.width(), self.height()], _noKeywordArguments))
+        instructions = self._instructionsStack[-1]
+        if callback == "lineTo" and instructions:
+            # collect a run of lineTo calls into a single instruction
+            lastCallback, lastArgs, _ = instructions[-1]
+            if lastCallback == "_lineToPoints":
+                lastArgs[0].append(args[0])
+                return
+            if lastCallback == "lineTo":
+                instructions[-1] = ("_lineToPoints", ([lastArgs[0], args[0]],), _noKeywordArguments)
+                return
+        # most instructions have no keyword arguments, share a single empty mapping instead of keeping a dict for each
+        instructions.append((callback, args, kwargs or _noKeywordArguments))
 
     def _drawInContext(self, context):
         if not self._instructionsStack:
             return
+        # resolve each context method once instead of once per instruction
+        methods = dict()
         for instructionSet in self._instructionsStack:
             for callback, args, kwargs in instructionSet:
-                attr = getattr(context, callback)
-                attr(*args, **kwargs)
+                method = methods.get(callback)
+                if method is None:
+                    method = methods[callback] = getattr(context, callback)
+                method(*args, **kwargs)
 
     def _reset(self, other=None):
         if other is not None:
@@ -240,11 +275,14 @@ class DrawBotDrawingTool:
         Returns the width and height of a specified canvas size.
         If no canvas size is given it will return the dictionary containing all possible page sizes.
         """
+        if paperSize and paperSize != "screen":
+            return _paperSizes[paperSize]
+        # only ask for the screen size when it is requested, the paper sizes table is left untouched
         w, h = AppKit.NSScreen.mainScreen().frame().size
-        _paperSizes["screen"] = int(w), int(h)
+        screenSize = int(w), int(h)
         if paperSize:
-            return _paperSizes[paperSize]
-        return _paperSizes
+            return screenSize
+        return dict(_paperSizes, screen=screenSize)
 
     def pageCount(self) -> int:
         """
@@ -287,10 +325,7 @@ class DrawBotDrawingTool:
         if self._isSinglePage:
             # dont allow to set a page size
             raise DrawBotError("Cannot set 'size' into a single page.")
-        if width in _paperSizes and isinstance(width, str):
-            width, height = _paperSizes[width]
-        if width == "screen":
-            width, height = AppKit.NSScreen.mainScreen().frame().size
+        width, height = _resolvePaperSize(width, height)
         if height is None and isinstance(width, float):
             width, height = width, width
         self._width = width
@@ -326,10 +361,7 @@ class DrawBotDrawingTool:
         if self._isSinglePage:
             # dont allow to add a page
             raise DrawBotError("Cannot add a 'newPage' into a single page.")
-        if width in _paperSizes and isinstance(width, str):
-            width, height = _paperSizes[width]
-        if width == "screen":
-            width, height = AppKit.NSScreen.mainScreen().frame().size
+        width, height = _resolvePaperSize(width, height)
         if width is None and height is None:
             width = self.width()
             height = self.height()
@@ -383,13 +415,12 @@ class DrawBotDrawingTool:
         """
         from .drawBotPageDrawingTools import DrawBotPage
 
-        instructions = []
-        for instructionSet in self._instructionsStack:
-            for callback, _, _ in instructionSet:
-                if callback == "newPage":
-                    instructions.append(instructionSet)
-                    break
-        return tuple(DrawBotPage(instructionSet) for instructionSet in instructions)
+        # a page always starts with its newPage instruction
+        return tuple(
+            DrawBotPage(instructionSet)
+            for instructionSet in self._instructionsStack
+            if instructionSet and instructionSet[0][0] == "newPage"
+        )
 
     def saveImage(self, path: SomePath, *args, **options: dict[str, Any]):
         """
@@ -617,6 +648,11 @@ class DrawBotDrawingTool:
         self._requiresNewFirstPage = True
         self._addInstruction("lineTo", (x, y))
 
+    def _lineToPoints(self, points):
+        # replay a run of lineTo instructions
+        for point in points:
+            self.lineTo(point)
+
     def curveTo(self, xy1: Point, xy2: Point, xy3: Point):
         """
         Curve to a point `x3`, `y3`.
@@ -768,9 +804,9 @@ class DrawBotDrawingTool:
             # draw a line between two given points
             line((100, 100), (900, 900))
         """
-        path = BezierPath()
-        path.line(point1, point2)
-        self.drawPath(path)
+        (x1, y1), (x2, y2) = point1, point2
+        self._requiresNewFirstPage = True
+        self._addInstruction("line", (x1, y1), (x2, y2))
 
     def polygon(self, *points: Point, **kwargs: bool):
         """
@@ -783,9 +819,14 @@ class DrawBotDrawingTool:
             # draw a polygon with x-amount of points
             polygon((100, 100), (100, 900), (900, 900), (200, 800), close=True)
         """
-        path = BezierPath()
-        path.polygon(*points, **kwargs)
-        self.drawPath(path)
+        if len(points) <= 1:
+            raise TypeError("polygon() expects more than a single point")
+        close = kwargs.pop("close", True)
+        if kwargs:
+            raise TypeError("unexpected keyword argument for this function")
+        points = tuple((x, y) for x, y in points)
+        self._requiresNewFirstPage = True
+        self._addInstruction("polygon", *points, close=close)
 
     # color
 
@@ -852,7 +893,7 @@ class DrawBotDrawingTool:
             rect(390, 390, 600, 600)
 
         """
-        if operation not in self._dummyContext._blendModeMap.keys():
+        if operation not in self._dummyContext._blendModeMap:
             raise DrawBotError("blend mode must be %s" % (", ".join(self._dummyContext._blendModeMap.keys())))
         self._requiresNewFirstPage = True
         self._addInstruction("blendMode", operation)
@@ -2473,6 +2514,8 @@ class DrawBotDrawingTool:
         success, error = self._dummyContext.uninstallFont(path)
         if path in self._tempInstalledFonts:
             del self._tempInstalledFonts[path]
+        # also clear cached memoized functions
+        clearMemoizeCache()
         if not success:
             warnings.warn("uninstall font: %s" % error)
         self._addInstruction("uninstallFont", path)
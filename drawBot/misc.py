@@ -383,6 +383,8 @@ def getExternalToolPath(root, toolName):
 # =================
 
 _memoizeCache = dict()
+_memoizeCacheSize = 4096
+_memoizeMissing = object()
 
 
 def clearMemoizeCache():
@@ -407,12 +409,15 @@ def memoize(function):
     @functools.wraps(function)
     def wrapper(*args):
         key = (function, args)
-        if key in _memoizeCache:
-            return _memoizeCache[key]
-        else:
+        # a single lookup, None results are cached as well
+        result = _memoizeCache.get(key, _memoizeMissing)
+        if result is _memoizeMissing:
             result = function(*args)
+            if len(_memoizeCache) >= _memoizeCacheSize:
+                # keep the cache bounded within a long drawing, drop the oldest entry
+                del _memoizeCache[next(iter(_memoizeCache))]
             _memoizeCache[key] = result
-            return result
+        return result
 
     return wrapper
 
@@ -5,6 +5,7 @@ import sys
 import tempfile
 import unittest
 from collections import OrderedDict
+from decimal import Decimal
 
 from fontTools.ttLib import TTFont
 from testSupport import StdOutCollector, testDataDir
@@ -125,6 +126,30 @@ class MiscTest(unittest.TestCase):
             fillColors.append(characterBound.formattedSubString.textProperties()["fill"])
         self.assertEqual(fillColors, [(1, 0, 0, 1), (0, 1, 0, 1), None])
 
+    def test_formattedString_copy(self):
+        fs = drawBot.FormattedString("foo", font="Skia", fontSize=20, fill=(1, 0, 0), openTypeFeatures=dict(liga=True))
+        fs.svgID = "bar"
+        new = fs.copy()
+        self.assertEqual(new.textProperties(), fs.textProperties())
+        self.assertEqual(str(new), "foo")
+        self.assertEqual(new.svgID, "bar")
+        new.openTypeFeatures(smcp=True)
+        new += "bar"
+        self.assertEqual(fs.textProperties()["openTypeFeatures"], dict(liga=True))
+        self.assertEqual(str(fs), "foo")
+
+    def test_formattedString_colorWithoutAlpha(self):
+        fs = drawBot.FormattedString()
+        fs.fill(1, 0, 0, None)
+        fs.stroke(0, 1, 0, None)
+        self.assertEqual(fs.textProperties()["fill"], (1, 0, 0, 1))
+        self.assertEqual(fs.textProperties()["stroke"], (0, 1, 0, 1))
+
+    def test_formattedString_greyDecimalColor(self):
+        fs = drawBot.FormattedString("foo", fill=Decimal("0.5"), stroke=Decimal("0.25"))
+        self.assertEqual(fs.textProperties()["fill"], (Decimal("0.5"),))
+        self.assertEqual(fs.textProperties()["stroke"], (Decimal("0.25"),))
+
     def test_polygon_notEnoughPoints(self):
         drawBot.newDrawing()
         with self.assertRaises(TypeError):
@@ -142,6 +167,79 @@ class MiscTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             drawBot.polygon((1, 2), (3, 4), closed=False, foo=123)
 
+    def test_pages_replayRecordedShapes(self):
+        drawBot.newDrawing()
+        drawBot.polygon((10, 20), (30, 40), (50, 10))
+        drawBot.polygon((10, 20), (30, 40), close=False)
+        drawBot.line((0, 0), (100, 100))
+        drawBot.newPath()
+        drawBot.moveTo((0, 0))
+        drawBot.lineTo((10, 0))
+        drawBot.lineTo((10, 10))
+        drawBot.lineTo((0, 10))
+        drawBot.closePath()
+        drawBot.drawPath()
+        # entering a page replays all recorded instructions into the drawing tool
+        with drawBot.pages()[0]:
+            drawBot.polygon((0, 0), (5, 5), (10, 0))
+        with tempfile.TemporaryDirectory() as tempDir:
+            drawBot.saveImage(os.path.join(tempDir, "shapes.pdf"))
+        drawBot.endDrawing()
+
+    def test_bezierPath_bulkShapes(self):
+        boxes = [(10, 20, 30, 40), (50, 60, 70, 80)]
+        lines = [((0, 0), (100, 100)), ((10, 0), (10, 100))]
+        path = drawBot.BezierPath()
+        path.rects(boxes)
+        path.ovals(boxes)
+        path.lines(lines)
+        expected = drawBot.BezierPath()
+        for box in boxes:
+            expected.rect(*box)
+        for box in boxes:
+            expected.oval(*box)
+        for point1, point2 in lines:
+            expected.line(point1, point2)
+        self.assertEqual(path.points, expected.points)
+        self.assertEqual([contour.open for contour in path], [contour.open for contour in expected])
+
+    def test_bezierPath_cacheInvalidation(self):
+        path = drawBot.BezierPath()
+        path.rect(0, 0, 10, 10)
+        self.assertEqual(len(path), 1)
+        self.assertEqual(path.onCurvePoints, ((0, 0), (10, 0), (10, 10), (0, 10)))
+        path.translate(10, 0)
+        self.assertEqual(path.onCurvePoints, ((10, 0), (20, 0), (20, 10), (10, 10)))
+        path.rect(20, 20, 10, 10)
+        self.assertEqual(len(path), 2)
+        path.reverse()
+        self.assertEqual(path.contours[0].clockwise, True)
+
+    def test_bezierPath_sharedNSBezierPath(self):
+        path = drawBot.BezierPath()
+        path.rect(0, 0, 10, 10)
+        self.assertEqual(len(path.onCurvePoints), 4)
+        # changes made directly to the NSBezierPath are picked up
+        nsPath = path.getNSBezierPath()
+        nsPath.appendBezierPathWithRect_(((20, 20), (10, 10)))
+        self.assertEqual(len(path.onCurvePoints), 8)
+        self.assertEqual(len(path), 2)
+        nsPath.removeAllPoints()
+        self.assertEqual(path.onCurvePoints, ())
+        self.assertEqual(path.bounds(), None)
+
+    def test_bezierPath_contoursAreNotShared(self):
+        path = drawBot.BezierPath()
+        path.rect(0, 0, 10, 10)
+        contour = path.contours[0]
+        contour.reverse()
+        contour.append([(100, 100)])
+        path[0].open = True
+        self.assertEqual(len(path.contours[0]), 4)
+        self.assertEqual(path.contours[0][0], [(0, 0)])
+        self.assertEqual(path.contours[0].open, False)
+        self.assertEqual(list(path)[0].clockwise, False)
+
     def test_image_imageResolution(self):
         path = os.path.join(testDataDir, "drawbot.png")
         dpi = drawBot.imageResolution(path)